@@ -8,7 +8,7 @@ goal attraction, and individual sheep targeting to drive the flock towards a des
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import List, NamedTuple, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -20,11 +20,34 @@ from planning.herding.utils import (
 )
 from planning.plan_type import DoNothing, DronePositions, Plan
 
+# -----------------------------------------------------------------------------
+# Numba Support
+# -----------------------------------------------------------------------------
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
 # -----------------------------------------------------------------------------
 # Constants
 # -----------------------------------------------------------------------------
 
 EPSILON = 1e-9
+# Slack on the centroid/spread goal shortcuts so rounding never flips a result
+# the exact per-sheep test would give; borderline cases fall through to it.
+GOAL_FEATURE_MARGIN = 1e-6
+# Radius of a generated job target, in units of the collected flock radius fN
+TARGET_RADIUS_FN_MULTIPLIER = 3.0
 
 
 def is_goal_satisfied(w: state.State, target: state.Target) -> bool:
@@ -37,19 +60,132 @@ def is_goal_satisfied(w: state.State, target: state.Target) -> bool:
 
     if isinstance(target, state.Circle) and target.radius is not None:
         # squared comparison for speed / numerical stability
-        tol_sq = target.radius * target.radius
-
-        # distances squared from each sheep to the target
-        diffs = w.flock - target.center.reshape(1, 2)
-        d2 = np.sum(diffs * diffs, axis=1)
-
-        return bool(np.all(d2 <= tol_sq))
+        center = target.center.reshape(2)
+        return bool(
+            _all_within_circle(
+                w.flock,
+                float(center[0]),
+                float(center[1]),
+                float(target.radius) * float(target.radius),
+            )
+        )
     elif isinstance(target, state.Polygon):
         return bool(np.all(points_inside_polygon(w.flock, target.points)))
 
     return False
 
 
+@njit(cache=True)
+def _all_within_circle(P: np.ndarray, cx: float, cy: float, r2: float) -> bool:
+    """True if every point of P lies within squared distance r2 of (cx, cy)."""
+    for i in range(P.shape[0]):
+        dx = P[i, 0] - cx
+        dy = P[i, 1] - cy
+        # Written so a NaN position fails the check instead of passing it
+        if not (dx * dx + dy * dy <= r2):
+            return False
+    return True
+
+
+def warm_up_goal_check():
+    """Compile the goal-check kernel now rather than on the first simulation tick."""
+    P = np.zeros((1, 2))
+    _all_within_circle(P, 0.0, 0.0, 1.0)
+    # The server loop checks read-only state views, a separate specialization
+    P.flags.writeable = False
+    _all_within_circle(P, 0.0, 0.0, 1.0)
+
+
+class GoalFeatures(NamedTuple):
+    """Flock summary shared by every goal check made against one world state."""
+
+    centroid: np.ndarray  # (2,) mean sheep position
+    spread: float  # max sheep distance from the centroid
+
+
+def compute_goal_features(w: state.State) -> Optional[GoalFeatures]:
+    """Summarize the flock once so several goal checks can reuse it."""
+    if w.flock.size == 0:
+        return None
+    centroid = w.flock.mean(axis=0)
+    diffs = w.flock - centroid
+    spread = float(np.sqrt(np.max(np.einsum("nd,nd->n", diffs, diffs))))
+    return GoalFeatures(centroid=centroid, spread=spread)
+
+
+def _circle_goal_from_features(
+    features: GoalFeatures, center: np.ndarray, radius: float
+) -> Optional[bool]:
+    """
+    Decide a circle goal from the flock summary alone, or return None.
+
+    The whole flock lies in the disc of radius `spread` around the centroid, so
+    that disc fitting inside the target proves success. The centroid is a convex
+    combination of the sheep, so it lying outside the target proves failure.
+    Anything in between needs the exact per-sheep test.
+    """
+    d = float(np.hypot(*(features.centroid - center)))
+    if d + features.spread < radius - GOAL_FEATURE_MARGIN:
+        return True
+    if d > radius + GOAL_FEATURE_MARGIN:
+        return False
+    return None
+
+
+def is_goal_satisfied_batch(
+    w: state.State,
+    targets: Sequence[state.Target],
+    features: Optional[GoalFeatures] = None,
+) -> np.ndarray:
+    """
+    Vectorized is_goal_satisfied over several targets at once.
+
+    Circle targets are packed into (K, 2) centers / (K,) radii and checked in a
+    single NumPy pass; polygon targets fall back to the per-target test.
+    When `features` (from compute_goal_features) is given, circles it already
+    decides skip the per-sheep pass. Returns a boolean array aligned with
+    `targets`.
+    """
+    result = np.zeros(len(targets), dtype=bool)
+    if w.flock.size == 0:
+        result[:] = True
+        return result
+
+    circle_idx = []
+    for i, t in enumerate(targets):
+        if not isinstance(t, state.Circle) or t.radius is None:
+            continue
+        decided = (
+            _circle_goal_from_features(features, t.center, t.radius)
+            if features is not None
+            else None
+        )
+        if decided is None:
+            circle_idx.append(i)
+        else:
+            result[i] = decided
+    if circle_idx:
+        centers = np.array([targets[i].center for i in circle_idx], dtype=float)
+        radii = np.array([targets[i].radius for i in circle_idx], dtype=float)
+
+        # (K, N) squared distances from every circle center to every sheep
+        diffs = w.flock[None, :, :] - centers[:, None, :]
+        d2 = np.einsum("knd,knd->kn", diffs, diffs)
+        result[circle_idx] = np.all(d2 <= (radii * radii)[:, None], axis=1)
+
+    for i, t in enumerate(targets):
+        if isinstance(t, state.Polygon):
+            result[i] = is_goal_satisfied(w, t)
+
+    return result
+
+
+class PlanContext(NamedTuple):
+    """Job-derived planning inputs; constant while the job list is unchanged."""
+
+    target: Optional[state.Target]  # target of the first active job, if any
+
+
 # -----------------------------------------------------------------------------
 # Shepherd Policy
 # -----------------------------------------------------------------------------
@@ -74,6 +210,8 @@ class ShepherdPolicy:
         conditionally_apply_repulsion: bool = True,
     ):
         self.fN = fN
+        # Default radius for job targets made from a bare point (scenario loads)
+        self.target_radius_default = fN * TARGET_RADIUS_FN_MULTIPLIER
         self.umax = umax
         self.too_close = too_close
         self.collect_standoff = collect_standoff
@@ -280,19 +418,43 @@ class ShepherdPolicy:
 
     def plan(self, world: state.State, jobs: List[state.Job], dt: float) -> Plan:
         """Return the movement plan for all drones."""
-        target = None
-        all_jobs_satisfied = True
+        return self.step_control(world, self.prepare(jobs), dt)
+
+    def prepare(self, jobs: List[state.Job]) -> PlanContext:
+        """
+        Resolve the job-dependent part of planning once.
 
+        The result only depends on the jobs, so a caller running several
+        substeps against the same job list can reuse it with step_control().
+        """
         for job in jobs:
             if job.is_active and job.target is not None:
-                if not is_goal_satisfied(world, job.target):
-                    all_jobs_satisfied = False
-
                 # TODO: Assign drones to different jobs instead of just picking the first active one
-                target = job.target
-                break
+                return PlanContext(target=job.target)
+        return PlanContext(target=None)
 
-        if all_jobs_satisfied:
+    def plan_and_step_n(self, world, jobs: List[state.Job], n: int) -> None:
+        """
+        Plan for and advance a simulation world by n substeps.
+
+        `world` is the simulation World (get_state_view/step/dt). The job
+        context is prepared once and the hot methods are bound once, so each
+        substep only pays for the control step and the physics step. Each
+        substep plans on a fresh zero-copy view because step() rebinds the
+        drone array.
+        """
+        ctx = self.prepare(jobs)
+        control_fn = self.step_control
+        step_fn = world.step
+        view_fn = world.get_state_view
+        dt = world.dt
+        for _ in range(n):
+            step_fn(control_fn(view_fn(), ctx, dt))
+
+    def step_control(self, world: state.State, ctx: PlanContext, dt: float) -> Plan:
+        """Return the movement plan for all drones given a prepared context."""
+        target = ctx.target
+        if target is None or is_goal_satisfied(world, target):
             return DoNothing()
 
         N_drones = world.drones.shape[0]
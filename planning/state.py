@@ -6,8 +6,10 @@ including the flock, drones, obstacles, and active jobs. It serves as the data c
 between the simulation engine, the planner, and the API.
 """
 
+import sys
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
+from functools import cached_property, lru_cache
 from datetime import datetime, timezone
 from typing import List, Literal, Optional, Union
 
@@ -18,6 +20,14 @@ import numpy as np
 # -----------------------------------------------------------------------------
 
 JobStatus = Literal["pending", "scheduled", "running", "completed", "cancelled"]
+
+# Interned status values. Jobs held in the server's JobCache always carry these
+# exact objects, so hot loops can compare statuses by identity (`is`).
+STATUS_PENDING = sys.intern("pending")
+STATUS_SCHEDULED = sys.intern("scheduled")
+STATUS_RUNNING = sys.intern("running")
+STATUS_COMPLETED = sys.intern("completed")
+STATUS_CANCELLED = sys.intern("cancelled")
 MaintainUntil = Union[
     Literal["target_is_reached"], float
 ]  # "target_is_reached" or UNIX timestamp
@@ -49,6 +59,11 @@ class Polygon:
 
     points: np.ndarray
 
+    @cached_property
+    def center(self) -> np.ndarray:
+        """Vertex centroid, computed once (points are never mutated in place)."""
+        return self.points.mean(axis=0)
+
     def to_dict(self) -> dict:
         return {
             "points": self.points.tolist(),
@@ -64,11 +79,79 @@ Target = Union[Circle, Polygon]
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _ts_to_iso(ts: float) -> str:
+    """
+    Format a UNIX timestamp as an ISO-8601 UTC string ending in "Z".
+
+    Job timestamps only change on lifecycle transitions, while to_dict() runs
+    for every job on every streamed frame, so each value is formatted once.
+    """
+    return (
+        datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace("+00:00", "Z")
+    )
+
+
+def job_fields_to_dict(
+    target: Optional[Target],
+    drone_count: int,
+    scenario_id: Optional[str],
+    status: JobStatus,
+    is_active: bool,
+    remaining_time: Optional[float],
+    start_at: Optional[float],
+    completed_at: Optional[float],
+    maintain_until: MaintainUntil,
+    created_at: float,
+    updated_at: float,
+    id: uuid.UUID,
+) -> dict:
+    """
+    Job.to_dict() from the job's field values, in Job's field order.
+
+    Lets callers holding a row of copied fields (the /state snapshot) build the
+    API dict without constructing a Job first.
+    """
+
+    def ts_to_iso(ts: Optional[float]) -> Optional[str]:
+        if ts is None:
+            return None
+        return _ts_to_iso(ts)
+
+    if maintain_until == "target_is_reached":
+        maintain_until_value = "target_is_reached"
+    else:
+        # maintain_until is a float timestamp here
+        maintain_until_value = ts_to_iso(maintain_until) or ""
+
+    return {
+        "id": str(id),
+        "target": target.to_dict() if target is not None else None,
+        "remaining_time": remaining_time,
+        "is_active": is_active,
+        "drone_count": drone_count,
+        "status": status,
+        "start_at": ts_to_iso(start_at),
+        "completed_at": ts_to_iso(completed_at),
+        "scenario_id": scenario_id,
+        "maintain_until": maintain_until_value,
+        "created_at": ts_to_iso(created_at),
+        "updated_at": ts_to_iso(updated_at),
+    }
+
+
+# Values for required Job fields that older pickles may lack
+_LEGACY_JOB_DEFAULTS = {"drone_count": 1}
+
+
+@dataclass(slots=True)
 class Job:
     """
     Represents a high-level task for the herding system (e.g., "move flock to X").
     Tracks lifecycle, scheduling, and progress.
+
+    Uses __slots__: the simulation loop reads job attributes every tick, and slot
+    access avoids a per-instance __dict__ lookup.
     """
 
     # Core configuration
@@ -95,42 +178,49 @@ class Job:
     updated_at: float  # UNIX timestamp
     id: uuid.UUID = field(default_factory=uuid.uuid4)
 
-    def to_dict(self) -> dict:
-        """Convert job state to a dictionary for API response."""
-
-        def ts_to_iso(ts: Optional[float]) -> Optional[str]:
-            if ts is None:
-                return None
-            return (
-                datetime.fromtimestamp(ts, tz=timezone.utc)
-                .isoformat()
-                .replace("+00:00", "Z")
-            )
-
-        def maintain_until_to_dict(mu: MaintainUntil) -> str:
-            if mu == "target_is_reached":
-                return "target_is_reached"
+    def __setstate__(self, state) -> None:
+        # Jobs pickled before Job used __slots__ carry a plain dict state;
+        # slotted pickles carry (None, slot_state)
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        for key, value in state.items():
+            object.__setattr__(self, key, value)
+        # Older pickles predate some fields; an unset slot would raise on read
+        for f in fields(self):
+            if f.name in state:
+                continue
+            if f.default is not MISSING:
+                value = f.default
+            elif f.default_factory is not MISSING:
+                value = f.default_factory()
+            elif f.name in _LEGACY_JOB_DEFAULTS:
+                value = _LEGACY_JOB_DEFAULTS[f.name]
             else:
-                # mu is a float timestamp here
-                result = ts_to_iso(mu)
-                return result if result is not None else ""
+                continue
+            object.__setattr__(self, f.name, value)
 
-        drone_count_value = getattr(self, "drone_count", 1)
+    @property
+    def target_center(self) -> Optional[np.ndarray]:
+        """Point the world steers toward for this job (circle center / polygon centroid)."""
+        return None if self.target is None else self.target.center
 
-        return {
-            "id": str(self.id),
-            "target": self.target.to_dict() if self.target is not None else None,
-            "remaining_time": self.remaining_time,
-            "is_active": self.is_active,
-            "drone_count": drone_count_value,
-            "status": self.status,
-            "start_at": ts_to_iso(self.start_at),
-            "completed_at": ts_to_iso(self.completed_at),
-            "scenario_id": self.scenario_id,
-            "maintain_until": maintain_until_to_dict(self.maintain_until),
-            "created_at": ts_to_iso(self.created_at),
-            "updated_at": ts_to_iso(self.updated_at),
-        }
+    def to_dict(self) -> dict:
+        """Convert job state to a dictionary for API response."""
+        return job_fields_to_dict(
+            self.target,
+            self.drone_count,
+            self.scenario_id,
+            self.status,
+            self.is_active,
+            self.remaining_time,
+            self.start_at,
+            self.completed_at,
+            self.maintain_until,
+            self.created_at,
+            self.updated_at,
+            self.id,
+        )
 
 
 # -----------------------------------------------------------------------------
@@ -8,12 +8,17 @@ layer for data persistence.
 
 from __future__ import annotations
 
+import logging
+import os
 import pickle
+import queue
+import sys
+import threading
 import traceback
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import time
 
@@ -32,6 +37,13 @@ DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 VALID_STATUSES = {"pending", "scheduled", "running", "completed", "cancelled"}
 
+# Serializes JobRepo's read-modify-write cycles on DB_PATH across threads. It
+# only prevents lost writes; stale fields in JobSyncWriter snapshots are
+# dropped by JobRepo.update_many
+_db_lock = threading.RLock()
+
+log = logging.getLogger(__name__)
+
 
 # -----------------------------------------------------------------------------
 # Helpers
@@ -109,7 +121,7 @@ def _normalize_status(status: str) -> Tuple[JobStatus, Optional[str]]:
             f"Invalid status: {status}. Must be one of: {', '.join(VALID_STATUSES)}",
         )
 
-    return status, None  # type: ignore
+    return sys.intern(status), None  # type: ignore
 
 
 def decide_initial_status(
@@ -139,6 +151,11 @@ def _sync_remaining_time_from_memory(db_job: Job, jobs_cache) -> None:
         db_job.remaining_time = mem_job.remaining_time
 
 
+def _reindex_cached_job(jobs_cache, job: Job) -> None:
+    """Tell the cache a job's status/is_active changed so its indexes stay valid."""
+    jobs_cache.reindex(job)
+
+
 # -----------------------------------------------------------------------------
 # Job Repository
 # -----------------------------------------------------------------------------
@@ -149,9 +166,21 @@ class JobRepo:
     Repository for persisting and retrieving jobs from PKL.
 
     Every method starts by loading the jobs from the database and ends by saving
-    the jobs back to the database if they've been modified.
+    the jobs back to the database if they've been modified. Each load/save cycle
+    holds _db_lock, since request threads and the background JobSyncWriter
+    share the file.
     """
 
+    def __init__(self):
+        # When each job field was last written, per job. Only the write-back
+        # snapshots need it, and they live in this process's memory too.
+        self._field_written_at: Dict[uuid.UUID, Dict[str, float]] = {}
+
+    def _mark_written(self, job_id: uuid.UUID, fields, at: float) -> None:
+        written = self._field_written_at.setdefault(job_id, {})
+        for k in fields:
+            written[k] = at
+
     def _load_jobs(self) -> List[Job]:
         """Load the jobs from the database, filtering out any with invalid targets."""
         if not DB_PATH.exists():
@@ -202,9 +231,16 @@ class JobRepo:
         return valid_jobs
 
     def _save_jobs(self, jobs: List[Job]):
-        """Save the jobs to the database."""
-        with open(DB_PATH, "wb") as f:
+        """
+        Save the jobs to the database.
+
+        Writes a temp file and swaps it in, so a reader never sees a half-written
+        pickle (which _load_jobs would treat as corrupt).
+        """
+        tmp_path = DB_PATH.with_name(DB_PATH.name + ".tmp")
+        with open(tmp_path, "wb") as f:
             pickle.dump(jobs, f)
+        os.replace(tmp_path, DB_PATH)
 
     def create(
         self,
@@ -217,78 +253,129 @@ class JobRepo:
         scenario_id: Optional[str],
     ) -> Job:
         """Create a new job in the database."""
-        jobs = self._load_jobs()
-        now = datetime.now(timezone.utc).timestamp()
-
-        new_job = Job(
-            id=uuid.uuid4(),
-            target=target,
-            remaining_time=None,
-            is_active=is_active,
-            drone_count=drone_count,
-            status=status,
-            start_at=start_at,
-            completed_at=None,
-            scenario_id=scenario_id,
-            created_at=now,
-            updated_at=now,
-            maintain_until="target_is_reached",
-        )
+        with _db_lock:
+            jobs = self._load_jobs()
+            now = time.time()
 
-        jobs.append(new_job)
-        self._save_jobs(jobs)
-        return new_job
+            new_job = Job(
+                id=uuid.uuid4(),
+                target=target,
+                remaining_time=None,
+                is_active=is_active,
+                drone_count=drone_count,
+                status=status,
+                start_at=start_at,
+                completed_at=None,
+                scenario_id=scenario_id,
+                created_at=now,
+                updated_at=now,
+                maintain_until="target_is_reached",
+            )
+
+            jobs.append(new_job)
+            self._save_jobs(jobs)
+            return new_job
 
     def get(self, job_id: uuid.UUID) -> Optional[Job]:
         """Retrieve a job by ID."""
-        jobs = self._load_jobs()
-        for job in jobs:
-            if job.id == job_id:
-                return job
-        return None
+        with _db_lock:
+            jobs = self._load_jobs()
+            for job in jobs:
+                if job.id == job_id:
+                    return job
+            return None
 
     def list(self, status: Optional[JobStatus] = None) -> List[Job]:
         """List all jobs, optionally filtered by status."""
-        jobs = self._load_jobs()
-        if status:
-            return [j for j in jobs if j.status == status]
-        return jobs
+        with _db_lock:
+            jobs = self._load_jobs()
+            if status:
+                return [j for j in jobs if j.status == status]
+            return jobs
 
     def update_fields(self, job_id: uuid.UUID, **fields) -> Optional[Job]:
         """Update specific fields of a job."""
-        if not fields:
-            return self.get(job_id)
+        with _db_lock:
+            if not fields:
+                return self.get(job_id)
 
-        jobs = self._load_jobs()
-        job = None
-        for j in jobs:
-            if j.id == job_id:
-                job = j
-                break
+            jobs = self._load_jobs()
+            job = None
+            for j in jobs:
+                if j.id == job_id:
+                    job = j
+                    break
 
-        if job is None:
-            return None
+            if job is None:
+                return None
 
-        for k, v in fields.items():
-            setattr(job, k, v)
+            for k, v in fields.items():
+                setattr(job, k, v)
 
-        job.updated_at = datetime.now(timezone.utc).timestamp()
-        self._save_jobs(jobs)
-        return job
+            job.updated_at = time.time()
+            self._mark_written(job_id, fields, job.updated_at)
+            self._save_jobs(jobs)
+            return job
+
+    def update_many(self, updates: Dict[uuid.UUID, dict]) -> int:
+        """
+        Apply field updates to several jobs with a single load/save.
+
+        An update that carries its own updated_at is a snapshot taken at that
+        time: fields written more recently (e.g. by a PATCH) keep their stored
+        value, and the rest are applied. A job's completed_at is kept along
+        with its status.
+        Returns the number of jobs that were found and updated.
+        """
+        with _db_lock:
+            if not updates:
+                return 0
+
+            jobs = self._load_jobs()
+            now = time.time()
+            updated = 0
+            for job in jobs:
+                fields = updates.get(job.id)
+                if fields is None:
+                    continue
+                fields = dict(fields)
+                stamp = fields.pop("updated_at", None)
+                if stamp is None:
+                    stamp = now
+                else:
+                    written = self._field_written_at.get(job.id, {})
+                    stale = {k for k in fields if written.get(k, 0.0) > stamp}
+                    if "status" in stale:
+                        stale.add("completed_at")
+                    for k in stale:
+                        fields.pop(k, None)
+                    if not fields:
+                        continue
+                for k, v in fields.items():
+                    setattr(job, k, v)
+                job.updated_at = max(job.updated_at or 0.0, stamp)
+                self._mark_written(job.id, fields, stamp)
+                updated += 1
+
+            if updated:
+                self._save_jobs(jobs)
+            return updated
 
     def delete(self, job_id: uuid.UUID):
         """
         Delete a job from the database.
         Returns True if job was deleted, False if job was not found.
         """
-        jobs = self._load_jobs()
-        original_count = len(jobs)
-        jobs = [j for j in jobs if j.id != job_id]
-
-        if len(jobs) < original_count:
-            self._save_jobs(jobs)
-            return True
-        return False
+        with _db_lock:
+            jobs = self._load_jobs()
+            original_count = len(jobs)
+            jobs = [j for j in jobs if j.id != job_id]
+
+            if len(jobs) < original_count:
+                self._field_written_at.pop(job_id, None)
+                self._save_jobs(jobs)
+                return True
+            return False
 
 
 # -----------------------------------------------------------------------------
@@ -306,14 +393,8 @@ def get_repo() -> JobRepo:
     return _repo_instance
 
 
-def sync_job_status_to_db(job: Job) -> None:
-    """
-    Sync a job's status, is_active, completed_at, and remaining_time to the database.
-
-    This is called from the main loop when jobs are promoted or completed.
-    It updates status-related fields and remaining_time for recovery.
-    """
-    repo = get_repo()
+def _job_status_fields(job: Job) -> dict:
+    """Status-related fields of a job, as persisted by the simulation loop."""
     updates = {
         "status": job.status,
         "is_active": 1 if job.is_active else 0,
@@ -321,7 +402,96 @@ def sync_job_status_to_db(job: Job) -> None:
     }
     if job.completed_at is not None:
         updates["completed_at"] = job.completed_at
-    repo.update_fields(job.id, **updates)
+    return updates
+
+
+# -----------------------------------------------------------------------------
+# Background Write-Back
+# -----------------------------------------------------------------------------
+
+
+class JobSyncWriter:
+    """
+    Write-back queue that persists job status changes off the simulation loop.
+
+    The loop enqueues a snapshot of each dirty job; once start() is called, a
+    daemon thread drains the queue, keeps only the latest snapshot per job,
+    and writes the batch with one JobRepo.update_many() call. Snapshots are
+    stamped with the time they were taken, so one that is still queued when
+    the API writes the job directly (PATCH) can't overwrite the fields that
+    write changed.
+    """
+
+    def __init__(self):
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, job: Job) -> None:
+        """Queue a snapshot of the job's status fields for persistence."""
+        taken_at = time.time()
+        self.submit_fields(job.id, _job_status_fields(job), taken_at)
+
+    def submit_fields(
+        self, job_id: uuid.UUID, fields: dict, taken_at: Optional[float] = None
+    ) -> None:
+        """
+        Queue arbitrary field updates for a job (merged with other pending ones).
+
+        taken_at is when the values were read (default: now); take it before
+        reading them, so a concurrent API write is never mistaken for older.
+        """
+        if taken_at is None:
+            taken_at = time.time()
+        self._queue.put_nowait((job_id, {**fields, "updated_at": taken_at}))
+
+    def start(self) -> None:
+        """Start the background writer thread (idempotent)."""
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="job-sync-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self.write_pending(block=True)
+
+    def write_pending(self, block: bool = False) -> int:
+        """
+        Drain the queue and write the coalesced updates.
+        Returns the number of jobs written.
+        """
+        pending: Dict[uuid.UUID, dict] = {}
+        try:
+            job_id, fields = self._queue.get(block=block)
+            pending[job_id] = fields
+            while True:
+                job_id, fields = self._queue.get_nowait()
+                pending.setdefault(job_id, {}).update(fields)
+        except queue.Empty:
+            pass
+
+        if not pending:
+            return 0
+        try:
+            return get_repo().update_many(pending)
+        except Exception as e:
+            # Don't crash - DB sync failure shouldn't stop the writer
+            log.warning("Failed to sync %d jobs to DB: %s", len(pending), e)
+            return 0
+
+
+_sync_writer_instance: Optional[JobSyncWriter] = None
+
+
+def get_sync_writer() -> JobSyncWriter:
+    """Get the global JobSyncWriter instance, creating if needed."""
+    global _sync_writer_instance
+    if _sync_writer_instance is None:
+        _sync_writer_instance = JobSyncWriter()
+    return _sync_writer_instance
 
 
 # -----------------------------------------------------------------------------
@@ -373,7 +543,7 @@ def create_jobs_blueprint(world_lock, jobs_cache, get_backend_adapter) -> Bluepr
                 )
 
         # Determine status and activation using centralized logic
-        now = datetime.now(timezone.utc).timestamp()
+        now = time.time()
         status, is_active = decide_initial_status(
             start_at_ts=start_at,
             activate_immediately=activate_immediately,
@@ -563,6 +733,7 @@ def create_jobs_blueprint(world_lock, jobs_cache, get_backend_adapter) -> Bluepr
                 for other_job in jobs_cache.list:
                     if other_job.id != job_id_uuid and other_job.is_active:
                         other_job.is_active = False
+                        _reindex_cached_job(jobs_cache, other_job)
                         repo.update_fields(other_job.id, is_active=0)
 
             # Update in database (if it exists there)
@@ -580,7 +751,8 @@ def create_jobs_blueprint(world_lock, jobs_cache, get_backend_adapter) -> Bluepr
                 for key, value in updates_mem.items():
                     setattr(job_mem, key, value)
                 # Sync updated_at
-                job_mem.updated_at = datetime.now(timezone.utc).timestamp()
+                job_mem.updated_at = time.time()
+                _reindex_cached_job(jobs_cache, job_mem)
 
                 # --- CRITICAL: Sync drone count with world if this is the active job ---
                 if "drone_count" in updates_mem:
@@ -20,27 +20,41 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 import json  # noqa: E402
-import random
+import logging
+import operator
+import os
 import threading
 import time
 import traceback
-from dataclasses import asdict
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from collections import deque
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from flask import Flask, Response, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 
 from planning import herding, state
 from planning.policy_configs import POLICY_PRESETS, build_policy
-from server import jobs_api
+from server import jobs_api, metrics
 from server.drone_management import create_drones_blueprint
 from server.metrics import end_metrics_run, get_collector, start_metrics_run
 from server.scenario_types import (
-    SCENARIO_TYPES,
     generate_initial_layout,
     get_scenario_type,
+    get_scenario_type_json,
+    list_scenario_types_json,
 )
 from server.scenarios_api import REPO, Scenario, scenarios_bp
 from simulation import world
@@ -77,34 +91,124 @@ FRAME_TIME = 1.0 / SIMULATION_LOOP_FPS
 # Speed: ~12.6x real-time.
 STEPS_PER_FRAME = 3
 
+# Goal Check Period
+# Minimum seconds between is_goal_satisfied checks for the same job. The flock
+# barely moves between consecutive heartbeats, so checking every frame is wasted work.
+GOAL_CHECK_PERIOD = 0.05
+GOAL_CHECK_PERIOD_NS = int(GOAL_CHECK_PERIOD * 1_000_000_000)
+
+# Drone Resize Debounce
+# Minimum time between drone-count changes driven by the active job, so rapid
+# UI edits don't resize the world's drone arrays every heartbeat.
+DRONE_RESIZE_DEBOUNCE_NS = 250_000_000
+
 #  Broadcast Speed (Network/Rendering)
 # How many times per second we send updates to the frontend.
 # Keep this lower (e.g., 30) to save network bandwidth and frontend rendering power.
 BROADCAST_FPS = 30
 BROADCAST_FRAME_TIME = 1.0 / BROADCAST_FPS
 
+# Longest a stream waits for a simulation tick before re-sending the current
+# frame anyway (keeps idle connections and proxies alive).
+STREAM_IDLE_TIMEOUT = 1.0
+
 # Allowed origins for CORS (development)
-ALLOWED_ORIGINS = ["http://localhost:5173", "http://127.0.0.1:5173"]
+DEFAULT_ORIGIN = "http://localhost:5173"
+ALLOWED_ORIGINS = frozenset({DEFAULT_ORIGIN, "http://127.0.0.1:5173"})
+
+# Include the traceback and scenario samples in /load-scenario error responses
+# (always on when Flask runs in debug mode)
+LOAD_SCENARIO_DEBUG = bool(os.environ.get("LOAD_SCENARIO_DEBUG"))
 
 # -----------------------------------------------------------------------------
 # Global State
 # -----------------------------------------------------------------------------
 
-# Thread-safe lock for world reinitialization
-world_lock = threading.RLock()
+log = logging.getLogger(__name__)
+
+
+class SeqLock:
+    """
+    World lock whose readers never block the simulation tick.
+
+    Writers use it like a plain Lock (`with world_lock:`), and each acquisition
+    bumps a sequence counter on entry and exit, so the counter is odd while a
+    write is in progress. It is not reentrant: no writer calls into another
+    one while holding it. Readers go through read(), which runs a copying
+    snapshot function without the lock and retries it if the counter was odd
+    or moved meanwhile, falling back to the lock after a few failed attempts.
+    """
+
+    def __init__(self, read_attempts: int = 3):
+        self._lock = threading.Lock()
+        self.seq = 0
+        self.read_attempts = read_attempts
+
+    def __enter__(self):
+        self._lock.acquire()
+        self.seq += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seq += 1
+        self._lock.release()
+        return False
+
+    def read(self, snapshot):
+        """Return snapshot() taken while no writer was active."""
+        for _ in range(self.read_attempts):
+            start = self.seq
+            if start & 1:
+                # Writer mid-tick; let it run instead of spinning
+                time.sleep(0)
+                continue
+            try:
+                result = snapshot()
+            except Exception:
+                # A torn read can fail halfway; only a clean one may raise
+                if self.seq == start:
+                    raise
+                continue
+            if self.seq == start:
+                return result
+        with self._lock:
+            return snapshot()
+
+
+# World lock for reinitialization and ticks; readers snapshot via world_lock.read()
+world_lock = SeqLock()
 current_scenario_id: Optional[str] = None  # Track what scenario is currently loaded
 
+# Notified by the simulation loop after every tick (counted in world_tick);
+# SSE streams wait on it
+world_updated = threading.Condition()
+world_tick = 0
+
 # -----------------------------------------------------------------------------
 # Utilities
 # -----------------------------------------------------------------------------
 
 
 class JobCache:
-    """Cache for jobs that maintains both list and O(1) dict lookup."""
+    """
+    Cache for jobs that maintains both list and O(1) dict lookup.
+
+    Also indexes jobs by lifecycle state (running/scheduled, the active job and
+    freshly completed IDs) so the simulation tick never has to scan every job.
+    Callers that mutate a cached job's status or is_active must call reindex().
+
+    `list` has no meaningful order: remove() swaps the last job into the freed
+    slot so deletes stay O(1).
+    """
 
     def __init__(self, initial: Optional[List[state.Job]] = None):
         self.list: List[state.Job] = []
         self.map: Dict[Any, state.Job] = {}
+        self._index: Dict[Any, int] = {}  # job ID -> position in list
+        self.running: Dict[Any, state.Job] = {}
+        self.scheduled: Dict[Any, state.Job] = {}
+        self.active_job: Optional[state.Job] = None
+        self.completed: Deque[Any] = deque()
         if initial:
             for j in initial:
                 self.add(j)
@@ -113,26 +217,80 @@ class JobCache:
         """Add a job, ensuring no duplicates by ID."""
         if job.id in self.map:
             return self.map[job.id]
+        self._index[job.id] = len(self.list)
         self.list.append(job)
         self.map[job.id] = job
+        self.reindex(job)
         return job
 
     def get(self, job_id: Any) -> Optional[state.Job]:
         """Get job by ID in O(1) time."""
         return self.map.get(job_id)
 
+    def snapshot(self) -> Tuple[state.Job, ...]:
+        """
+        Immutable copy of the current jobs, for read-only passes outside world_lock.
+
+        Take it under the lock; iterating it afterwards is safe even while API
+        threads add or swap-pop jobs in `list`.
+        """
+        return tuple(self.list)
+
+    def reindex(self, job: state.Job):
+        """Refresh the status indexes after a job's status or is_active changed."""
+        job_id = job.id
+        # Statuses may arrive from JSON or pickles; intern so the loop can use `is`
+        job.status = sys.intern(job.status)
+        self.running.pop(job_id, None)
+        self.scheduled.pop(job_id, None)
+        if job_id not in self.map:
+            if self.active_job is job:
+                self.active_job = None
+            return
+
+        status = job.status
+        if status is state.STATUS_RUNNING:
+            self.running[job_id] = job
+        elif status is state.STATUS_SCHEDULED:
+            self.scheduled[job_id] = job
+        elif status is state.STATUS_COMPLETED and job.completed_at is not None:
+            self.completed.append(job_id)
+
+        if status is state.STATUS_RUNNING and job.is_active:
+            self.active_job = job
+        elif self.active_job is job:
+            # Fall back to any other running+active job (normally there is none)
+            self.active_job = next(
+                (j for j in self.running.values() if j.is_active), None
+            )
+
+    def purge_completed(self):
+        """
+        Drop jobs that the simulation loop has marked completed.
+
+        A job can be reopened (e.g. by a PATCH) between being queued and the
+        purge, so each one is re-checked and only removed if still completed.
+        """
+        while self.completed:
+            job_id = self.completed.popleft()
+            if (
+                j := self.map.get(job_id)
+            ) is not None and j.status is state.STATUS_COMPLETED:
+                self.remove(job_id)
+
     def remove(self, job_id: Any) -> Optional[state.Job]:
         """Remove job by ID."""
         # Remove from map first
         j = self.map.pop(job_id, None)
 
         if j is not None:
-            # Remove from list by finding the index using ID comparison (not object comparison)
-            # This avoids issues with numpy array comparisons in job objects
-            for i, job in enumerate(self.list):
-                if job.id == job_id:
-                    del self.list[i]
-                    break
+            self.reindex(j)
+            # Swap-pop: move the last job into the removed slot
+            i = self._index.pop(job_id)
+            last = self.list.pop()
+            if i < len(self.list):
+                self.list[i] = last
+                self._index[last.id] = i
 
         return j
 
@@ -140,6 +298,11 @@ class JobCache:
         """Clear all jobs from the cache."""
         self.list.clear()
         self.map.clear()
+        self._index.clear()
+        self.running.clear()
+        self.scheduled.clear()
+        self.active_job = None
+        self.completed.clear()
 
     def reset_with(self, jobs: List[state.Job]):
         """Clear and replace with new jobs (maintains same cache object reference)."""
@@ -148,6 +311,23 @@ class JobCache:
             self.add(j)
 
 
+def _pending_order(job: state.Job):
+    """Queue order: scheduled jobs (with start_at) by start_at, then the rest by created_at."""
+    return (
+        job.start_at if job.start_at is not None else float("inf"),
+        job.created_at,
+    )
+
+
+def _next_pending_job(jobs: List[state.Job]) -> Optional[state.Job]:
+    """The pending job with a target that runs next, independent of list order."""
+    return min(
+        (j for j in jobs if j.status is state.STATUS_PENDING and j.target is not None),
+        key=_pending_order,
+        default=None,
+    )
+
+
 def _create_policy_for_world(w: world.World) -> herding.ShepherdPolicy:
     """
     Create a herding policy matched to the given world's flock size.
@@ -168,16 +348,14 @@ def initialize_sim():
     # Calculate appropriate k_nn based on flock size (must be <= N-1)
     k_nn = min(21, max(1, flock_size - 1))
 
+    # Draw both coordinates straight into one (N, 2) array; per-axis bounds broadcast
+    (x_lo, x_hi), (y_lo, y_hi) = DEFAULT_SHEEP_X_RANGE, DEFAULT_SHEEP_Y_RANGE
+    sheep_xy = np.random.default_rng().uniform(
+        (x_lo, y_lo), (x_hi, y_hi), size=(flock_size, 2)
+    )
+
     backend_adapter = world.World(
-        sheep_xy=np.array(
-            [
-                [
-                    random.uniform(*DEFAULT_SHEEP_X_RANGE),
-                    random.uniform(*DEFAULT_SHEEP_Y_RANGE),
-                ]
-                for _ in range(flock_size)
-            ]
-        ),
+        sheep_xy=sheep_xy,
         shepherd_xy=np.array([[0.0, 0.0]]),
         target_xy=None,  # No target by default - user must set via frontend
         boundary="none",
@@ -211,22 +389,181 @@ def initialize_sim():
 
 def _ensure_polygon_array(poly_like):
     """Validate and normalize polygon input to Nx2 array with N>=3."""
+    # No copy when the input is already a float64 array
     arr = np.asarray(poly_like, dtype=float)
     if arr.ndim != 2 or arr.shape[1] != 2 or len(arr) < 3:
         raise ValueError("polygon must be an Nx2 array with N>=3")
-    # Accept closed rings; drop duplicate closing vertex if present
-    if np.allclose(arr[0], arr[-1]):
+    # Accept closed rings; drop duplicate closing vertex if present.
+    # Scalar form of np.allclose(first, last) without its temporaries.
+    x0, y0 = arr[0].tolist()
+    x1, y1 = arr[-1].tolist()
+    if abs(x0 - x1) <= 1e-8 + 1e-5 * abs(x1) and abs(y0 - y1) <= 1e-8 + 1e-5 * abs(y1):
         arr = arr[:-1]
     return arr
 
 
+def _ensure_polygon_arrays(polys_like):
+    """
+    Validate and normalize a list of polygons for World.add_polygons.
+
+    Equal-length input is converted and checked as one (K, N, 2) batch, which
+    is returned as-is. Ragged input, or rings where only some are closed, fall
+    back to a list built by _ensure_polygon_array per polygon.
+    """
+    try:
+        batch = np.asarray(polys_like, dtype=float)
+    except (ValueError, TypeError):
+        batch = None
+    if batch is None or batch.ndim != 3 or batch.shape[2] != 2 or batch.shape[1] < 3:
+        return [_ensure_polygon_array(p) for p in polys_like]
+
+    # Same tolerance as the per-polygon closed-ring check
+    closed = np.isclose(batch[:, 0], batch[:, -1]).all(axis=1)
+    if closed.all():
+        return batch[:, :-1]
+    if closed.any():
+        return [_ensure_polygon_array(p) for p in batch]
+    return batch
+
+
+class StateBroadcaster:
+    """
+    Shares one encoded state between GET /state and all /stream/state subscribers.
+
+    Every change to the world or the jobs happens under world_lock, which bumps
+    its sequence number. The state is encoded once per sequence value, so
+    readers between two ticks reuse the same bytes without touching world_lock.
+    SSE frames are additionally capped at one re-check per broadcast interval.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._adapter: Any = None
+        self._seq: Optional[int] = None
+        self._expires = 0.0
+        self._body = b""
+        self._frame = b""
+
+    def _refresh(self):
+        """Re-encode the state if the world changed since the last encode."""
+        seq = world_lock.seq
+        # A scenario load or restart swaps the world; never serve its old state
+        if self._adapter is backend_adapter and seq == self._seq:
+            return
+        self._body = _encode_state_body()
+        self._frame = b"event: stateUpdate\ndata: " + self._body + b"\n\n"
+        self._adapter = backend_adapter
+        # An odd sequence means a write was in flight; don't key on it
+        self._seq = None if seq & 1 else seq
+
+    def body(self) -> bytes:
+        """Get the current state as JSON bytes (the GET /state response body)."""
+        with self._lock:
+            self._refresh()
+            return self._body
+
+    def frame(self) -> bytes:
+        """Get the current SSE frame, re-checking it if the interval has elapsed."""
+        now = time.monotonic()
+        with self._lock:
+            if self._adapter is not backend_adapter or now >= self._expires:
+                self._refresh()
+                self._expires = now + self.interval
+            return self._frame
+
+
+def _json_default(obj):
+    """Encode numpy arrays and scalars for the stdlib json fallback."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize obj (numpy arrays allowed) to JSON bytes, using orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, installed as app.json when available.
+
+    jsonify() then skips the stdlib encoder and accepts numpy values. Output
+    otherwise follows DefaultJSONProvider: sorted keys, HTTP-date datetimes and
+    its fallback conversions, and indentation in debug mode.
+    """
+
+    def _dumpb(self, obj, indent: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dumpb(obj, indent=bool(kwargs.get("indent"))).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self._dumpb(obj, indent=indent) + b"\n", mimetype=self.mimetype
+        )
+
+
+# Reads every Job field in one call, in constructor order, so a snapshot row
+# feeds state.job_fields_to_dict later without touching the live job
+_job_fields = operator.attrgetter(*(f.name for f in fields(state.Job)))
+
+
+def _encode_state_body() -> bytes:
+    """Snapshot the world and jobs and encode them as the /state JSON body."""
+    return dumps_json(_state_payload(world_lock.read(_snapshot_state)))
+
+
+def _snapshot_state():
+    """
+    Copy the raw world arrays and job fields (run via world_lock.read).
+
+    Only cheap copies happen here; building dicts and encoding are left to the
+    caller so they never overlap a simulation tick.
+    """
+    return (
+        backend_adapter.get_state(),
+        [_job_fields(j) for j in jobs_cache.list],
+        backend_adapter.paused,
+    )
+
+
+def _state_payload(snapshot) -> Dict[str, Any]:
+    """
+    Build the state dict for dumps_json from a _snapshot_state() result.
+
+    Same shape as State.to_dict() plus "paused", but the copied arrays are kept
+    as-is so the encoder serializes them directly instead of via tolist().
+    """
+    world_state, job_rows, paused = snapshot
+    return {
+        "flock": world_state.flock,
+        "drones": world_state.drones,
+        "jobs": [state.job_fields_to_dict(*row) for row in job_rows],
+        "polygons": world_state.polygons,
+        "paused": paused,
+    }
+
+
 def get_allowed_origin():
     """Get the allowed origin from the request, or return the first allowed origin."""
     origin = request.headers.get("Origin")
-    if origin in ALLOWED_ORIGINS:
-        return origin
-    # Default to first allowed origin if no match or no origin header
-    return ALLOWED_ORIGINS[0]
+    # Default to the primary allowed origin if no match or no origin header
+    return origin if origin in ALLOWED_ORIGINS else DEFAULT_ORIGIN
 
 
 # -----------------------------------------------------------------------------
@@ -234,8 +571,12 @@ def get_allowed_origin():
 # -----------------------------------------------------------------------------
 
 backend_adapter, policy, jobs_cache = initialize_sim()
+herding.policy.warm_up_goal_check()
 
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonProvider(app)
+state_broadcaster = StateBroadcaster(BROADCAST_FRAME_TIME)
 
 # Register Blueprints
 app.register_blueprint(scenarios_bp)
@@ -275,8 +616,9 @@ def handle_preflight():
 @app.after_request
 def after_request(response):
     """Add CORS headers to all responses."""
-    # For streaming responses, headers are set directly in the Response object
-    if response.mimetype == "text/event-stream":
+    # Preflights already got their headers in handle_preflight, and streaming
+    # responses set them directly in the Response object
+    if request.method == "OPTIONS" or response.mimetype == "text/event-stream":
         return response
 
     origin = request.headers.get("Origin")
@@ -306,12 +648,8 @@ def get_state():
     """Get current simulation state with pause status."""
     if request.method == "OPTIONS":
         return Response(status=200)
-    with world_lock:
-        state = backend_adapter.get_state()
-        state.jobs = jobs_cache.list
-        state_dict = state.to_dict()
-        state_dict["paused"] = backend_adapter.paused
-        return jsonify(state_dict)
+    # Shared with the SSE stream and only re-encoded after a world write
+    return Response(state_broadcaster.body(), mimetype="application/json")
 
 
 @app.route("/stream/state", methods=["GET", "OPTIONS"])
@@ -323,25 +661,26 @@ def stream_state():
     def generate():
         while True:
             try:
-                # Acquire lock for thread-safe state access
-                with world_lock:
-                    state = backend_adapter.get_state()
-                    state.jobs = jobs_cache.list
-                    state_dict = state.to_dict()
-                    state_dict["paused"] = backend_adapter.paused
-
-                # Format as SSE event with event type
-                event_data = f"event: stateUpdate\ndata: {json.dumps(state_dict)}\n\n"
-                yield event_data
-
-                # Sleep to maintain target FPS (30Hz for network/rendering)
-                time.sleep(BROADCAST_FRAME_TIME)
+                # Frame is shared across subscribers (serialized once per tick)
+                sent_tick = world_tick
+                yield state_broadcaster.frame()
+                sent = time.monotonic()
+
+                # Cap at BROADCAST_FPS (the loop ticks faster), then send as soon
+                # as a newer tick exists instead of polling on a timer
+                delay = sent + BROADCAST_FRAME_TIME - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                with world_updated:
+                    world_updated.wait_for(
+                        lambda: world_tick != sent_tick, timeout=STREAM_IDLE_TIMEOUT
+                    )
 
             except GeneratorExit:
                 # Client disconnected
                 break
             except Exception as e:
-                print("Error in stream_state:", e)
+                log.warning("Error in stream_state: %s", e)
                 # Log error but continue streaming with keepalive
                 yield ": keepalive\n\n"
                 time.sleep(FRAME_TIME)
@@ -368,7 +707,7 @@ def stream_state():
 def patch_state():
     """Update simulation state (polygons, target, pause)."""
     data = request.get_json(silent=True) or {}
-    print(data)
+    log.debug("PATCH /state %s", data)
 
     with world_lock:
         # 1) Clear polygons
@@ -395,8 +734,7 @@ def patch_state():
                     400,
                 )
             try:
-                polys = [_ensure_polygon_array(p) for p in polys_in]
-                backend_adapter.add_polygons(polys)
+                backend_adapter.add_polygons(_ensure_polygon_arrays(polys_in))
             except ValueError as ve:
                 return jsonify({"ok": False, "error": str(ve)}), 400
             except Exception as e:
@@ -604,11 +942,13 @@ def load_scenario(scenario_id):
             if scenario.targets and len(scenario.targets) > 0:
                 target_pos = np.array(scenario.targets[0], dtype=float)
                 # Create a Circle target with the position and a reasonable radius
-                target = state.Circle(center=target_pos, radius=policy.fN * 3.0)
+                target = state.Circle(
+                    center=target_pos, radius=policy.target_radius_default
+                )
 
             # Create an in-memory job for the simulation (NOT persisted to database)
             # This keeps simulation state separate from farm jobs
-            now = datetime.now(timezone.utc).timestamp()
+            now = time.time()
             scenario_job = state.Job(
                 id=uuid4(),
                 target=target,
@@ -655,37 +995,46 @@ def load_scenario(scenario_id):
         )
 
     except Exception as e:
+        log.exception("Failed to load scenario %s", scenario_id)
         error_details = {
             "type": "ServerError",
             "message": f"Failed to load scenario: {str(e)}",
             "scenario_id": str(scenario_id),
-            "scenario_found": scenario is not None,
-            "scenario_data": {
-                "name": scenario.name if scenario else None,
-                "sheep_count": (
-                    len(scenario.sheep) if scenario and scenario.sheep else 0
-                ),
-                "drone_count": (
-                    len(scenario.drones) if scenario and scenario.drones else 0
-                ),
-                "targets_count": (
-                    len(scenario.targets) if scenario and scenario.targets else 0
-                ),
-                "boundary": scenario.boundary if scenario else None,
-                "bounds": scenario.bounds if scenario else None,
-                "sheep_sample": (
-                    scenario.sheep[:3] if scenario and scenario.sheep else None
-                ),
-                "drones_sample": (
-                    scenario.drones[:3] if scenario and scenario.drones else None
-                ),
-                "targets_sample": (
-                    scenario.targets[:3] if scenario and scenario.targets else None
-                ),
-            },
-            "traceback": traceback.format_exc(),
         }
-        print(f"Load scenario error: {error_details}")
+        # The detailed payload is only built on request: a client retrying a bad
+        # scenario would otherwise get a traceback and data dump every time
+        if not (app.debug or LOAD_SCENARIO_DEBUG):
+            return jsonify({"error": error_details}), 500
+
+        error_details.update(
+            {
+                "scenario_found": scenario is not None,
+                "scenario_data": {
+                    "name": scenario.name if scenario else None,
+                    "sheep_count": (
+                        len(scenario.sheep) if scenario and scenario.sheep else 0
+                    ),
+                    "drone_count": (
+                        len(scenario.drones) if scenario and scenario.drones else 0
+                    ),
+                    "targets_count": (
+                        len(scenario.targets) if scenario and scenario.targets else 0
+                    ),
+                    "boundary": scenario.boundary if scenario else None,
+                    "bounds": scenario.bounds if scenario else None,
+                    "sheep_sample": (
+                        scenario.sheep[:3] if scenario and scenario.sheep else None
+                    ),
+                    "drones_sample": (
+                        scenario.drones[:3] if scenario and scenario.drones else None
+                    ),
+                    "targets_sample": (
+                        scenario.targets[:3] if scenario and scenario.targets else None
+                    ),
+                },
+                "traceback": traceback.format_exc(),
+            }
+        )
         return jsonify({"error": error_details}), 500
 
 
@@ -744,15 +1093,14 @@ def get_policy_presets():
 @app.route("/scenario-types", methods=["GET"])
 def get_scenario_types():
     """Get all available scenario type definitions."""
-    types_list = [st.to_dict() for st in SCENARIO_TYPES.values()]
-    return jsonify(types_list), 200
+    return Response(list_scenario_types_json(), mimetype="application/json")
 
 
 @app.route("/scenario-types/<key>", methods=["GET"])
 def get_scenario_type_endpoint(key: str):
     """Get a specific scenario type definition by key."""
-    scenario_type = get_scenario_type(key)
-    if not scenario_type:
+    body = get_scenario_type_json(key)
+    if body is None:
         return (
             jsonify(
                 {
@@ -765,7 +1113,7 @@ def get_scenario_type_endpoint(key: str):
             404,
         )
 
-    return jsonify(scenario_type.to_dict()), 200
+    return Response(body, mimetype="application/json")
 
 
 @app.route("/scenario-types/<key>/instantiate", methods=["POST"])
@@ -864,7 +1212,12 @@ def instantiate_scenario_type(key: str):
 
     REPO.create(scenario)
 
-    return jsonify(asdict(scenario)), 201, {"Location": f"/scenarios/{scenario.id}"}
+    return Response(
+        scenario.to_json(),
+        status=201,
+        headers={"Location": f"/scenarios/{scenario.id}"},
+        mimetype="application/json",
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -998,219 +1351,200 @@ if __name__ == "__main__":
     # Start Flask in a background thread.
     threading.Thread(target=run_flask, daemon=True).start()
 
+    # Persist job status changes from the loop on a background thread
+    jobs_api.get_sync_writer().start()
+
     # Throttle remaining_time DB writes (once per second)
-    last_rem_sync_ts = 0.0
+    last_rem_sync_ns = 0
+
+    # Resolved once; the loop only touches it while metrics.METRICS_ENABLED
+    collector = get_collector()
+
+    # Last time (monotonic ns) the loop resized the world's drones
+    last_drone_resize_ns = 0
+
+    # Last time (monotonic ns) each running job's goal was checked
+    last_goal_check_ns: Dict[Any, int] = {}
 
     while True:
         # Get current jobs from cache
         jobs = jobs_cache.list
 
-
         time.sleep(FRAME_TIME)
+
+        # Read the clocks once per tick: monotonic for throttling, wall time
+        # for timestamps that are persisted or compared against start_at
+        tick_ns = time.monotonic_ns()
+        tick_wall_ts = time.time()
+
         # Update job statuses and remaining times
-        jobs_to_sync = set()  # Use set to avoid duplicate syncs
+        jobs_to_sync: List[Any] = []  # Usually empty; de-duplicated before syncing
         with world_lock:
             # Promote any scheduled jobs that should now start
-            now = datetime.now().timestamp()
-            for j in jobs:
-                if (
-                    j.status == "scheduled"
-                    and j.start_at is not None
-                    and j.start_at <= now
-                ):
-                    # Check if there's currently an active job
-                    has_active_job = any(
-                        other.is_active and other.status == "running"
-                        for other in jobs
-                        if other.id != j.id
-                    )
+            # (copy only when there is something to promote; most ticks have nothing)
+            due_scheduled = (
+                [
+                    j
+                    for j in jobs_cache.scheduled.values()
+                    if j.start_at is not None and j.start_at <= tick_wall_ts
+                ]
+                if jobs_cache.scheduled
+                else ()
+            )
+            for j in due_scheduled:
+                if jobs_cache.active_job is None:
+                    # No active job - promote to running and activate immediately
+                    j.status = state.STATUS_RUNNING
+                    j.is_active = True
+                else:
+                    # There's an active job - add this scheduled job to the queue as pending
+                    j.status = state.STATUS_PENDING
+                jobs_cache.reindex(j)
+                jobs_to_sync.append(j.id)
 
-                    if not has_active_job:
-                        # No active job - promote to running and activate immediately
-                        j.status = "running"
-                        j.is_active = True
-                        jobs_to_sync.add(j.id)
-                    else:
-                        # There's an active job - add this scheduled job to the queue as pending
-                        j.status = "pending"
-                        jobs_to_sync.add(j.id)
+            # Forget jobs that left running any other way (PATCH, delete, restart)
+            for job_id in [
+                k for k in last_goal_check_ns if k not in jobs_cache.running
+            ]:
+                del last_goal_check_ns[job_id]
 
             # Check goal satisfaction and update remaining_time
-            for job in jobs:
-                if job.target is None:
+            # Only running jobs can change here; everything else keeps remaining_time=None
+            due_jobs = []
+            for job in jobs_cache.running.values():
+                if job.target is None or not job.is_active:
                     job.remaining_time = None
-                elif job.status == "completed" or job.status == "cancelled":
-                    # Don't update completed/cancelled jobs
-                    pass
-                elif job.status == "running" and job.is_active:
-                    # Only check goal for running+active jobs
-                    if herding.policy.is_goal_satisfied(
-                        backend_adapter.get_state(), job.target
-                    ):
-                        job.remaining_time = 0
-                        # Double-check status before marking completed (race protection)
-                        if job.status == "running" and job.is_active:
-                            job.status = "completed"
-                            job.is_active = False
-                            job.completed_at = datetime.now(timezone.utc).timestamp()
-                            jobs_to_sync.add(job.id)
-
-                            # Activate the next pending job in the queue
-                            # Order: scheduled jobs by start_at, then regular pending jobs by created_at
-                            pending_jobs = [
-                                j
-                                for j in jobs
-                                if j.status == "pending" and j.target is not None
-                            ]
-                            if pending_jobs:
-                                # Sort: scheduled jobs (with start_at) first by start_at,
-                                # then regular pending jobs by created_at
-                                pending_jobs.sort(
-                                    key=lambda j: (
-                                        (
-                                            j.start_at
-                                            if j.start_at is not None
-                                            else float("inf")
-                                        ),
-                                        j.created_at,
-                                    )
-                                )
-                                next_job = pending_jobs[0]
-                                next_job.status = "running"
-                                next_job.is_active = True
-                                jobs_to_sync.add(next_job.id)
-                    else:
-                        job.remaining_time = None
-                else:
+                elif (
+                    tick_ns - last_goal_check_ns.get(job.id, 0) >= GOAL_CHECK_PERIOD_NS
+                ):
+                    last_goal_check_ns[job.id] = tick_ns
+                    due_jobs.append(job)
+
+            # One vectorized check for every job that is due this tick
+            satisfied = ()
+            if due_jobs:
+                goal_view = backend_adapter.get_state_view()
+                satisfied = herding.policy.is_goal_satisfied_batch(
+                    goal_view,
+                    [j.target for j in due_jobs],
+                    herding.policy.compute_goal_features(goal_view),
+                )
+            for job, done in zip(due_jobs, satisfied):
+                if not done:
                     job.remaining_time = None
-
-        # Persist status changes to database (outside lock to avoid blocking)
+                    continue
+
+                last_goal_check_ns.pop(job.id, None)
+                job.remaining_time = 0
+                job.status = state.STATUS_COMPLETED
+                job.is_active = False
+                job.completed_at = tick_wall_ts
+                jobs_cache.reindex(job)
+                jobs_to_sync.append(job.id)
+
+                # Activate the next pending job in the queue
+                # Order: scheduled jobs by start_at, then regular pending jobs by created_at
+                next_job = _next_pending_job(jobs)
+                if next_job is not None:
+                    next_job.status = state.STATUS_RUNNING
+                    next_job.is_active = True
+                    jobs_cache.reindex(next_job)
+                    jobs_to_sync.append(next_job.id)
+
+        # Hand status changes to the background DB writer (never blocks the loop)
         if jobs_to_sync:
-            for job_id in jobs_to_sync:
+            sync_writer = jobs_api.get_sync_writer()
+            for job_id in dict.fromkeys(jobs_to_sync):
                 job_obj = jobs_cache.get(job_id)  # O(1) lookup instead of linear search
                 if job_obj:
-                    try:
-                        jobs_api.sync_job_status_to_db(job_obj)
-                    except Exception as e:
-                        # Don't crash - DB sync failure shouldn't stop simulation
-                        print(f"Warning: Failed to sync job {job_id} to DB: {e}")
+                    sync_writer.submit(job_obj)
 
         # Throttled remaining_time sync (once per second for running jobs)
-        current_time = time.time()
-        if current_time - last_rem_sync_ts >= 1.0:
-            for job in jobs:
-                if job.status == "running" and job.remaining_time is not None:
-                    try:
-                        jobs_api.sync_job_status_to_db(job)
-                    except Exception as e:
-                        print(
-                            f"Warning: Failed to sync remaining_time for job {job.id}: {e}"
-                        )
-            last_rem_sync_ts = current_time
+        if tick_ns - last_rem_sync_ns >= 1_000_000_000:
+            # Queued on the same single writer as status changes, so file writes
+            # stay ordered and the loop never waits on the DB
+            sync_writer = jobs_api.get_sync_writer()
+            taken_at = time.time()
+            with world_lock:
+                jobs_snapshot = jobs_cache.snapshot()
+            for j in jobs_snapshot:
+                if j.status is state.STATUS_RUNNING and j.remaining_time is not None:
+                    sync_writer.submit_fields(
+                        j.id,
+                        {"remaining_time": j.remaining_time, "status": j.status},
+                        taken_at,
+                    )
+            last_rem_sync_ns = tick_ns
 
         # We receive the new state of the world from the backend adapter, and we compute what we should do based on the planner.
         # We send that back to the backend adapter.
         with world_lock:
             # Sync target from active job to world, and auto-unpause if there's an active job with a target
-            active_job = None
-            for job in jobs:
-                if job.is_active and job.status == "running":
-                    active_job = job
-                    break
-
-            if active_job and active_job.target is not None:
-                # Sync job target to world target
-                # Extract center coordinates from Circle/Polygon for the World (which expects numpy array)
-                if isinstance(active_job.target, state.Circle):
-                    backend_adapter.target = active_job.target.center
-                elif isinstance(active_job.target, state.Polygon):
-                    # For polygon, use centroid as target
-                    backend_adapter.target = active_job.target.points.mean(axis=0)
-                else:
-                    raise TypeError(
-                        f"Job target must be Circle or Polygon, got {type(active_job.target)}"
-                    )
+            active_job = jobs_cache.active_job
 
-                # Sync drone count from job to world
-                if active_job.drone_count != backend_adapter.num_controllers:
-                    backend_adapter.set_drone_count(active_job.drone_count)
+            # Next pending job with a target: the world/metrics fallback when
+            # nothing active has a target. Found in one pass and reused below.
+            pending_target_job = None
+            if active_job is None or active_job.target is None:
+                pending_target_job = _next_pending_job(jobs)
 
-                # Auto-unpause if paused
-                if backend_adapter.paused:
-                    backend_adapter.paused = False
-            elif active_job and active_job.target is None:
-                # Active job but no target yet - keep running for visualization (sheep will graze)
-                # Also sync drone count
-                if active_job.drone_count != backend_adapter.num_controllers:
+            if active_job is not None:
+                # Sync job target to world target (circle center / cached polygon centroid).
+                # An active job without a target keeps running with no target (sheep graze)
+                new_target = active_job.target_center
+
+                # Sync drone count from job to world (debounced)
+                if (
+                    active_job.drone_count != backend_adapter.num_controllers
+                    and tick_ns - last_drone_resize_ns >= DRONE_RESIZE_DEBOUNCE_NS
+                ):
                     backend_adapter.set_drone_count(active_job.drone_count)
-                if backend_adapter.paused:
-                    backend_adapter.paused = False
-                backend_adapter.target = None
+                    last_drone_resize_ns = tick_ns
             else:
-                # No active job - allow simulation to run for live monitoring
-                if backend_adapter.paused:
-                    backend_adapter.paused = False
-
-                # If we have a pending job with a target, use it for the world target
+                # No active job - if we have a pending job with a target, use it for the world target
                 # This ensures the policy (and visualization) knows where to go even if the job isn't "started"
-                pending_target_job = None
-                for job in jobs:
-                    if job.status == "pending" and job.target is not None:
-                        pending_target_job = job
-                        break
-
-                if pending_target_job:
-                    # Sync pending job target to world target
-                    if isinstance(pending_target_job.target, state.Circle):
-                        backend_adapter.target = pending_target_job.target.center
-                    elif isinstance(pending_target_job.target, state.Polygon):
-                        backend_adapter.target = pending_target_job.target.points.mean(
-                            axis=0
-                        )
-                else:
-                    # Only clear target if we really have no target source
-                    backend_adapter.target = None
+                new_target = (
+                    pending_target_job.target_center if pending_target_job else None
+                )
+
+            # Always keep the simulation running (auto-unpause, or live monitoring
+            # when idle). Only write world attributes when they actually change;
+            # target_center returns the same array object every tick.
+            if backend_adapter.paused:
+                backend_adapter.paused = False
+            if backend_adapter.target is not new_target:
+                backend_adapter.target = new_target
 
-            for job in list(jobs):  # Copy to avoid modifying list while iterating
-                if job.completed_at is not None:
-                    jobs_cache.remove(job.id)
+            jobs_cache.purge_completed()
 
             # Run multiple simulation steps per frame to speed up simulation
             # while maintaining smooth 60Hz updates
-            for _ in range(STEPS_PER_FRAME):
-                plan = policy.plan(
-                    backend_adapter.get_state(), jobs, backend_adapter.dt
-                )
-                backend_adapter.step(plan)
+            policy.plan_and_step_n(backend_adapter, jobs, STEPS_PER_FRAME)
 
             # Record metrics if collection is active
-            # from server.metrics import get_collector
-
-            collector = get_collector()
-            if collector.get_current_run() is not None:
-                world_state = backend_adapter.get_state()
+            if metrics.METRICS_ENABLED:
+                world_state = backend_adapter.get_state_view()
 
                 # Determine target for metrics
                 target = None
                 if active_job and active_job.target:
                     target = active_job.target
                 else:
-                    # Try to find a pending job with a target
-                    for job in jobs:
-                        if job.status == "pending" and job.target:
-                            target = job.target
-                            break
+                    # Try the pending job with a target found above
+                    if pending_target_job is not None:
+                        target = pending_target_job.target
 
                     # Fallback to world target if still no job target found
                     if target is None and backend_adapter.target is not None:
-                        from planning import state
-
-                        radius = policy.fN if hasattr(policy, "fN") else 10.0
                         target = state.Circle(
-                            center=backend_adapter.target, radius=radius
+                            center=backend_adapter.target, radius=policy.fN
                         )
 
-                t = backend_adapter.t if hasattr(backend_adapter, "t") else 0.0
-                fN = policy.fN if hasattr(policy, "fN") else 50.0
+                # The loop always drives a World and a ShepherdPolicy, so t and
+                # fN are part of the contract rather than optional attributes
+                collector.record_step(world_state, target, backend_adapter.t, policy.fN)
 
-                collector.record_step(world_state, target, t, fN)
+        # Wake the SSE streams now that a new state exists
+        with world_updated:
+            world_tick += 1
+            world_updated.notify_all()
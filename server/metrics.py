@@ -14,6 +14,9 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from planning import state
+from planning.herding.utils import points_inside_polygon
+
 # -----------------------------------------------------------------------------
 # Constants
 # -----------------------------------------------------------------------------
@@ -23,6 +26,10 @@ STEPS_TO_KEEP_HEAD = 100
 MAX_COMPLETED_RUNS = 50
 EPSILON = 1e-6
 
+# True while the global collector has an active run. Hot loops check this
+# plain module flag instead of calling into the collector every frame.
+METRICS_ENABLED = False
+
 
 # -----------------------------------------------------------------------------
 # Data Structures
@@ -156,6 +163,7 @@ class MetricsCollector:
             self.end_run()
 
         self.current_run = RunMetrics(run_id=run_id)
+        self._publish_enabled()
         return self.current_run
 
     def end_run(self) -> Optional[RunMetrics]:
@@ -175,8 +183,15 @@ class MetricsCollector:
 
         run = self.current_run
         self.current_run = None
+        self._publish_enabled()
         return run
 
+    def _publish_enabled(self):
+        """Mirror this collector's state into METRICS_ENABLED if it is the global one."""
+        global METRICS_ENABLED
+        if self is _collector:
+            METRICS_ENABLED = self.current_run is not None
+
     def record_step(
         self,
         world_state,
@@ -215,8 +230,6 @@ class MetricsCollector:
         gcm_to_goal = 0.0
 
         if target is not None:
-            from planning import state
-
             if isinstance(target, state.Circle):
                 # Distance from each agent to goal center
                 distances_to_goal = np.linalg.norm(
@@ -228,8 +241,6 @@ class MetricsCollector:
                 gcm_to_goal = float(np.linalg.norm(gcm - np.array(target.center)))
             elif isinstance(target, state.Polygon):
                 # For polygons, use point-in-polygon check
-                from planning.herding.utils import points_inside_polygon
-
                 inside = points_inside_polygon(flock, target.points)
                 fraction_in_goal = float(np.sum(inside) / len(flock))
                 # Use centroid for distance
@@ -13,8 +13,10 @@ appropriate settings for different use cases.
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional
+import json
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import numpy as np
 
@@ -26,19 +28,24 @@ DEFAULT_AGENT_COUNT = 50
 DEFAULT_CONTROLLER_COUNT = 2
 BOUNDS_PADDING = 5.0
 
+# Shared generator for unseeded layouts, so those calls skip building a fresh
+# SeedSequence/BitGenerator (draws are serialized by the bit generator's lock)
+_DEFAULT_RNG = np.random.default_rng()
+
 
 # -----------------------------------------------------------------------------
 # Data Structures
 # -----------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScenarioTypeDefinition:
     """
     Definition for a reusable scenario type/behavior pack.
 
     Provides defaults for world physics, policy behavior, and visual appearance
-    that can be used as a starting point for new scenarios.
+    that can be used as a starting point for new scenarios. Definitions are
+    immutable once built; the registry shares them across requests.
     """
 
     key: str
@@ -60,21 +67,52 @@ class ScenarioTypeDefinition:
     recommended_controllers: Optional[int] = None
 
     # Tags for categorization
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
 
     # Environment (farm, city, ocean)
     environment: str = "farm"
 
+    # Agent layout generator for generate_initial_layout, derived from the tags
+    # once here instead of on every call. Internal: not part of to_dict().
+    layout_mode: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        layout_mode = "clusters" if "clusters" in self.tags else "default"
+        object.__setattr__(self, "layout_mode", layout_mode)
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        Built field by field rather than with asdict(), which deep-copies
+        recursively. Nested containers are shallow-copied so callers can't
+        modify the registry's definitions through the result.
+        """
+        return {
+            "key": self.key,
+            "name": self.name,
+            "description": self.description,
+            "default_world_config": _copy_config(self.default_world_config),
+            "default_policy_config": _copy_config(self.default_policy_config),
+            "default_theme_key": self.default_theme_key,
+            "default_icon_set": self.default_icon_set,
+            "recommended_agents": self.recommended_agents,
+            "recommended_controllers": self.recommended_controllers,
+            "tags": list(self.tags),
+            "environment": self.environment,
+        }
+
+
+def _copy_config(config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Shallow-copy a config dict (its values are scalars), keeping None as None."""
+    return None if config is None else dict(config)
 
 
 # -----------------------------------------------------------------------------
 # Scenario Registry
 # -----------------------------------------------------------------------------
 
-SCENARIO_TYPES: Dict[str, ScenarioTypeDefinition] = {
+_SCENARIO_TYPES: Dict[str, ScenarioTypeDefinition] = {
     "herding_standard": ScenarioTypeDefinition(
         key="herding_standard",
         name="Herding",
@@ -89,7 +127,7 @@ SCENARIO_TYPES: Dict[str, ScenarioTypeDefinition] = {
         default_icon_set="herding",
         recommended_agents=50,
         recommended_controllers=2,
-        tags=["herding", "farm", "standard"],
+        tags=("herding", "farm", "standard"),
         environment="farm",
     ),
     "evacuation_prototype": ScenarioTypeDefinition(
@@ -103,7 +141,6 @@ SCENARIO_TYPES: Dict[str, ScenarioTypeDefinition] = {
             "boundary": "reflect",
             "k_nn": 1,  # Minimal flocking - people don't herd like sheep
             "wa": 0.1,  # Very low attraction - people don't clump
-
             "w_align": 0.2,  # Low alignment - people move independently
             "graze_alpha": 0.0,  # No random grazing
             "vmax": 0.6,  # Realistic walking speed
@@ -121,7 +158,7 @@ SCENARIO_TYPES: Dict[str, ScenarioTypeDefinition] = {
         default_icon_set="evacuation",
         recommended_agents=40,
         recommended_controllers=3,
-        tags=["evacuation", "urban", "city", "research"],
+        tags=("evacuation", "urban", "city", "research"),
         environment="city",
     ),
     "oil_spill_cleanup": ScenarioTypeDefinition(
@@ -146,11 +183,75 @@ SCENARIO_TYPES: Dict[str, ScenarioTypeDefinition] = {
         default_icon_set="oil",
         recommended_agents=100,
         recommended_controllers=4,
-        tags=["oil", "ocean", "cleanup", "slow"],
+        tags=("oil", "ocean", "cleanup", "slow"),
         environment="ocean",
     ),
 }
 
+# Read-only view shared by all request threads: lookups stay plain dict reads,
+# but nothing can add, replace or drop a type after import.
+SCENARIO_TYPES: Mapping[str, ScenarioTypeDefinition] = MappingProxyType(_SCENARIO_TYPES)
+
+
+# The registry never changes after import, so its JSON is encoded once up front
+# (compact and key-sorted, like Flask's jsonify) instead of on every request.
+_SCENARIO_TYPE_JSON: Dict[str, bytes] = {
+    key: json.dumps(st.to_dict(), sort_keys=True, separators=(",", ":")).encode()
+    for key, st in SCENARIO_TYPES.items()
+}
+_SCENARIO_TYPES_LIST_JSON = b"[" + b",".join(_SCENARIO_TYPE_JSON.values()) + b"]"
+
+
+# -----------------------------------------------------------------------------
+# Agent Layouts
+# -----------------------------------------------------------------------------
+
+
+def _layout_clusters(rng: np.random.Generator, n_agents: int, bounds: tuple):
+    """Agents in 2-4 normally distributed clusters away from the edges."""
+    xmin, xmax, ymin, ymax = bounds
+    width = xmax - xmin
+    height = ymax - ymin
+
+    n_clusters = min(4, max(2, n_agents // 30))
+    agents_per_cluster = n_agents // n_clusters
+    spread = np.array([width * 0.08, height * 0.08])
+    # Equal-sized clusters, written straight into one buffer (no list + vstack)
+    agents = np.empty((n_clusters * agents_per_cluster, 2))
+
+    for i in range(n_clusters):
+        cx = rng.uniform(xmin + width * 0.2, xmax - width * 0.2)
+        cy = rng.uniform(ymin + height * 0.2, ymax - height * 0.2)
+        # Same draws as rng.normal(loc, scale), scaled and shifted in place
+        cluster = agents[i * agents_per_cluster : (i + 1) * agents_per_cluster]
+        rng.standard_normal(out=cluster)
+        cluster *= spread
+        cluster += (cx, cy)
+
+    return agents
+
+
+def _layout_default(rng: np.random.Generator, n_agents: int, bounds: tuple):
+    """Agents moderately clustered, uniformly, in the central region."""
+    xmin, xmax, ymin, ymax = bounds
+    width = xmax - xmin
+    height = ymax - ymin
+    center_x = (xmin + xmax) / 2
+    center_y = (ymin + ymax) / 2
+
+    return rng.uniform(
+        low=[center_x - width * 0.25, center_y - height * 0.25],
+        high=[center_x + width * 0.25, center_y + height * 0.25],
+        size=(n_agents, 2),
+    )
+
+
+# ScenarioTypeDefinition.layout_mode -> agent generator (rng, n_agents, bounds)
+_AGENT_LAYOUTS = {
+    "clusters": _layout_clusters,
+    "default": _layout_default,
+}
+
 
 # -----------------------------------------------------------------------------
 # Public API
@@ -167,6 +268,16 @@ def list_scenario_types() -> List[ScenarioTypeDefinition]:
     return list(SCENARIO_TYPES.values())
 
 
+def get_scenario_type_json(key: str) -> Optional[bytes]:
+    """Get a scenario type's pre-encoded JSON by key."""
+    return _SCENARIO_TYPE_JSON.get(key)
+
+
+def list_scenario_types_json() -> bytes:
+    """Pre-encoded JSON array of all scenario types, in registry order."""
+    return _SCENARIO_TYPES_LIST_JSON
+
+
 def generate_initial_layout(
     scenario_type: ScenarioTypeDefinition,
     num_agents: Optional[int] = None,
@@ -187,7 +298,7 @@ def generate_initial_layout(
     Returns:
         Dictionary with 'sheep', 'drones', 'targets' keys containing position lists
     """
-    rng = np.random.default_rng(seed)
+    rng = np.random.default_rng(seed) if seed is not None else _DEFAULT_RNG
 
     n_agents = num_agents or scenario_type.recommended_agents or DEFAULT_AGENT_COUNT
     n_controllers = (
@@ -197,61 +308,35 @@ def generate_initial_layout(
     )
 
     xmin, xmax, ymin, ymax = bounds
-    width = xmax - xmin
-    height = ymax - ymin
     center_x = (xmin + xmax) / 2
     center_y = (ymin + ymax) / 2
 
     # --- Generate Agents ---
-    if "clusters" in scenario_type.tags:
-        # Clusters: agents in 2-4 clusters
-        n_clusters = min(4, max(2, n_agents // 30))
-        agents_per_cluster = n_agents // n_clusters
-        agent_groups = []
-
-        for _ in range(n_clusters):
-            cx = rng.uniform(xmin + width * 0.2, xmax - width * 0.2)
-            cy = rng.uniform(ymin + height * 0.2, ymax - height * 0.2)
-            cluster = rng.normal(
-                loc=[cx, cy],
-                scale=[width * 0.08, height * 0.08],
-                size=(agents_per_cluster, 2),
-            )
-            agent_groups.append(cluster)
-
-        agents = np.vstack(agent_groups)[:n_agents]
-    else:
-        # Default: moderately clustered in center region
-        agents = rng.uniform(
-            low=[center_x - width * 0.25, center_y - height * 0.25],
-            high=[center_x + width * 0.25, center_y + height * 0.25],
-            size=(n_agents, 2),
-        )
+    agents = _AGENT_LAYOUTS[scenario_type.layout_mode](rng, n_agents, bounds)
 
-    # Clip to bounds
-    agents[:, 0] = np.clip(agents[:, 0], xmin + BOUNDS_PADDING, xmax - BOUNDS_PADDING)
-    agents[:, 1] = np.clip(agents[:, 1], ymin + BOUNDS_PADDING, ymax - BOUNDS_PADDING)
+    # Clip to bounds in place; the (x, y) limits broadcast over both columns
+    clip_lo = np.array([xmin + BOUNDS_PADDING, ymin + BOUNDS_PADDING])
+    clip_hi = np.array([xmax - BOUNDS_PADDING, ymax - BOUNDS_PADDING])
+    np.clip(agents, clip_lo, clip_hi, out=agents)
 
     # --- Generate Controllers ---
     # Evenly spaced around the agents
     agent_center = agents.mean(axis=0)
-    agent_radius = np.max(np.linalg.norm(agents - agent_center, axis=1))
+    # sqrt is monotonic, so take it once on the largest squared distance
+    diffs = agents - agent_center
+    agent_radius = float(np.sqrt((diffs * diffs).sum(axis=1).max()))
     controller_radius = agent_radius * 1.5 + 20.0
 
-    controllers = np.zeros((n_controllers, 2))
-    for i in range(n_controllers):
-        angle = 2 * np.pi * i / n_controllers
-        controllers[i] = agent_center + controller_radius * np.array(
-            [np.cos(angle), np.sin(angle)]
-        )
+    # Unit ring written into one buffer, then scaled and centered in place
+    angles = 2 * np.pi * np.arange(n_controllers) / n_controllers
+    controllers = np.empty((n_controllers, 2))
+    np.cos(angles, out=controllers[:, 0])
+    np.sin(angles, out=controllers[:, 1])
+    controllers *= controller_radius
+    controllers += agent_center
 
     # Clip controllers to bounds
-    controllers[:, 0] = np.clip(
-        controllers[:, 0], xmin + BOUNDS_PADDING, xmax - BOUNDS_PADDING
-    )
-    controllers[:, 1] = np.clip(
-        controllers[:, 1], ymin + BOUNDS_PADDING, ymax - BOUNDS_PADDING
-    )
+    np.clip(controllers, clip_lo, clip_hi, out=controllers)
 
     # --- Generate Targets ---
     if scenario_type.key == "evacuation_prototype":
@@ -263,8 +348,9 @@ def generate_initial_layout(
     obstacles: List[List[float]] = []
 
     return {
-        "sheep": [[float(x), float(y)] for x, y in agents],
-        "drones": [[float(x), float(y)] for x, y in controllers],
+        # tolist() yields nested lists of native Python floats in one C pass
+        "sheep": agents.astype(np.float64, copy=False).tolist(),
+        "drones": controllers.astype(np.float64, copy=False).tolist(),
         "targets": targets,
         "obstacles": obstacles,
     }
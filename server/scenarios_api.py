@@ -9,16 +9,25 @@ from __future__ import annotations
 
 import hashlib
 import json
+import math
 import pickle
 import threading
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Literal, NamedTuple, Optional, Tuple
 from uuid import UUID, uuid4
 
 import numpy as np
-from flask import Blueprint, jsonify, request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from flask import Blueprint, Response, request
 
 from simulation.scenarios import (
     spawn_circle,
@@ -39,6 +48,28 @@ Vec2 = Tuple[float, float]
 Visibility = Literal["private", "public", "preset"]
 
 
+# -----------------------------------------------------------------------------
+# JSON Encoding
+# -----------------------------------------------------------------------------
+
+
+def _dumps(obj) -> bytes:
+    """
+    Compact, key-sorted JSON bytes, like jsonify; uses orjson if installed.
+
+    orjson is only a speedup: values it rejects but the stdlib accepts (e.g.
+    integers wider than 64 bits) are encoded by json.dumps instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            pass
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+
 # -----------------------------------------------------------------------------
 # Data Structures
 # -----------------------------------------------------------------------------
@@ -101,25 +132,92 @@ class Scenario:
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
 
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON bytes, compact and key-sorted like Flask's jsonify.
+
+        Scenarios are not modified once created, so the encoding is cached on
+        the instance (outside the dataclass fields, so asdict() and pickling
+        are unaffected).
+        """
+        body = self.__dict__.get("_json")
+        if body is None:
+            d = asdict(self)
+            d["id"] = str(self.id)
+            body = _dumps(d)
+            self.__dict__["_json"] = body
+        return body
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_json", None)
+        return state
+
 
 # -----------------------------------------------------------------------------
 # Repository
 # -----------------------------------------------------------------------------
 
 
+class _ScenarioIndex(NamedTuple):
+    """
+    Immutable lookup tables over every scenario, rebuilt after a change.
+
+    The ordered sets (dicts of ID -> None) keep listing order: presets first,
+    then custom scenarios oldest first.
+    """
+
+    items: Dict[UUID, Scenario]
+    by_tag: Dict[str, Dict[UUID, None]]
+    by_visibility: Dict[str, Dict[UUID, None]]
+    # Lowercased (name, description, tags) for the `q` substring search
+    text: Dict[UUID, Tuple[str, str, str]]
+    # created_at as a POSIX timestamp (NaN if unparsable), for the
+    # created_after/before filters
+    created_ts: Dict[UUID, float]
+    # (sort key, reverse) -> all IDs in that order, filled in on first use
+    orders: Dict[Tuple[str, bool], List[UUID]]
+
+    def sorted_ids(self, key: str, reverse: bool) -> List[UUID]:
+        """All IDs sorted by a Scenario attribute (stable, like list.sort)."""
+        order = self.orders.get((key, reverse))
+        if order is None:
+            items = self.items
+            order = sorted(
+                items, key=lambda sid: getattr(items[sid], key), reverse=reverse
+            )
+            self.orders[(key, reverse)] = order
+        return order
+
+
 class ScenarioRepo:
     """
     Repository for persisting and retrieving scenarios from PKL.
 
-    Every mutating method loads from disk, modifies, and saves back.
-    Preset scenarios are kept in memory and merged with custom scenarios from disk.
+    Custom scenarios are loaded from disk once and written back after every
+    change. Preset scenarios are kept in memory only and merged with them.
+
+    Assumes a single server process owns DB_PATH: the file is never re-read,
+    so scenarios written by another process or worker are not seen, and the
+    next save here overwrites them.
+
+    Writers serialize on a lock and bump a version counter (odd while a write
+    is in progress). Readers run without the lock and only fall back to it when
+    a write overlapped them, so concurrent GETs never block each other.
     """
 
     def __init__(self, cap: int = 500):
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._version = 0
         self._presets: Dict[UUID, Scenario] = {}  # Preset scenarios (in-memory only)
-        self._idem: Dict[str, UUID] = {}
+        # Custom scenarios, oldest first (the order they are evicted in)
+        self._items: Dict[UUID, Scenario] = {
+            s.id: s for s in self._load_custom_scenarios()
+        }
+        # Idempotency-Key -> (created scenario ID, hash of the request body)
+        self._idem: Dict[str, Tuple[UUID, str]] = {}
         self._cap = cap
+        self._index: Optional[_ScenarioIndex] = None  # None until next list()
 
     def _load_custom_scenarios(self) -> List[Scenario]:
         """Load custom scenarios from the database."""
@@ -132,53 +230,100 @@ class ScenarioRepo:
             print(f"Warning: Failed to load scenarios from {DB_PATH}: {e}")
             return []
 
-    def _save_custom_scenarios(self, scenarios: List[Scenario]):
-        """Save custom scenarios to the database."""
-        # Only save non-preset scenarios
-        custom_scenarios = [s for s in scenarios if s.visibility != "preset"]
+    def _save_custom_scenarios(self):
+        """Save custom scenarios to the database (call while writing)."""
         # Evict oldest if over capacity
-        while len(custom_scenarios) > self._cap:
-            custom_scenarios.pop(0)
+        while len(self._items) > self._cap:
+            del self._items[next(iter(self._items))]
         try:
             with open(DB_PATH, "wb") as f:
-                pickle.dump(custom_scenarios, f)
+                pickle.dump(list(self._items.values()), f)
         except Exception as e:
             print(f"Warning: Failed to save scenarios to {DB_PATH}: {e}")
 
+    @contextmanager
+    def _writing(self):
+        """Hold the write lock, with the version odd for the duration."""
+        with self._lock:
+            self._version += 1
+            try:
+                yield
+            finally:
+                self._index = None
+                self._version += 1
+
+    def _read(self, fn):
+        """Run a read-only fn optimistically; retry under the lock on overlap."""
+        version = self._version
+        if not version & 1:
+            try:
+                result = fn()
+            except RuntimeError:
+                # A dict resized mid-iteration; only a clean read may raise
+                if self._version == version:
+                    raise
+            else:
+                if self._version == version:
+                    return result
+        with self._lock:
+            return fn()
+
+    def _build_index(self) -> _ScenarioIndex:
+        """Index all scenarios by tag and visibility (call under the lock)."""
+        items = {**self._presets, **self._items}
+        by_tag: Dict[str, Dict[UUID, None]] = {}
+        by_visibility: Dict[str, Dict[UUID, None]] = {}
+        text: Dict[UUID, Tuple[str, str, str]] = {}
+        created_ts: Dict[UUID, float] = {}
+        for sid, s in items.items():
+            for t in s.tags:
+                by_tag.setdefault(t, {})[sid] = None
+            by_visibility.setdefault(s.visibility, {})[sid] = None
+            text[sid] = (
+                (s.name or "").lower(),
+                (s.description or "").lower(),
+                " ".join(s.tags).lower(),
+            )
+            try:
+                created_ts[sid] = _parse_timestamp(s.created_at)
+            except (TypeError, ValueError):
+                # NaN compares false, so a bad stored value fails any date bound
+                created_ts[sid] = math.nan
+        return _ScenarioIndex(items, by_tag, by_visibility, text, created_ts, {})
+
+    def _current_index(self) -> _ScenarioIndex:
+        """The index for the current contents, building it after a write."""
+        index = self._index
+        if index is None:
+            with self._lock:
+                index = self._index
+                if index is None:
+                    index = self._index = self._build_index()
+        return index
+
     def add_preset(self, s: Scenario) -> Scenario:
         """Add a preset scenario (in-memory only, not persisted)."""
-        with self._lock:
+        with self._writing():
             self._presets[s.id] = s
             return s
 
     def create(self, s: Scenario) -> Scenario:
         """Create a new scenario in the database."""
-        with self._lock:
+        with self._writing():
             if s.visibility == "preset":
                 # Presets are stored in memory only
                 self._presets[s.id] = s
                 return s
 
-            # Load, add, and save custom scenarios
-            scenarios = self._load_custom_scenarios()
-            # Check if already exists (by ID)
-            existing_ids = {sc.id for sc in scenarios}
-            if s.id not in existing_ids:
-                scenarios.append(s)
-            self._save_custom_scenarios(scenarios)
+            # Add (unless it already exists) and save custom scenarios
+            self._items.setdefault(s.id, s)
+            self._save_custom_scenarios()
             return s
 
     def get(self, sid: UUID) -> Optional[Scenario]:
         """Retrieve a scenario by ID."""
-        with self._lock:
-            # Check presets first
-            if sid in self._presets:
-                return self._presets[sid]
-            # Check custom scenarios
-            for s in self._load_custom_scenarios():
-                if s.id == sid:
-                    return s
-            return None
+        # Check presets first, then custom scenarios
+        return self._read(lambda: self._presets.get(sid) or self._items.get(sid))
 
     def list(
         self,
@@ -186,70 +331,84 @@ class ScenarioRepo:
         q: Optional[str],
         tag: Optional[str],
         visibility: Optional[Visibility],
-        created_after: Optional[str],
-        created_before: Optional[str],
+        created_after: Optional[float],
+        created_before: Optional[float],
         sort: str,
         limit: int,
         offset: int,
     ) -> Tuple[List[Scenario], int]:
-        """List scenarios with filtering and pagination."""
-        with self._lock:
-            # Combine presets and custom scenarios
-            items = list(self._presets.values()) + self._load_custom_scenarios()
-
-        def match(s: Scenario) -> bool:
-            if q:
-                qq = q.lower()
-                if (
-                    qq not in (s.name or "").lower()
-                    and qq not in (s.description or "").lower()
-                    and qq not in " ".join(s.tags).lower()
-                ):
-                    return False
-            if tag and tag not in s.tags:
-                return False
-            if visibility and s.visibility != visibility:
-                return False
-            if created_after and s.created_at <= created_after:
-                return False
-            if created_before and s.created_at >= created_before:
-                return False
-            return True
-
-        items = [s for s in items if match(s)]
+        """
+        List scenarios with filtering and pagination.
+
+        created_after/created_before are POSIX timestamps (see _parse_timestamp
+        for turning ISO-8601 query strings into them).
+        """
+        index = self._current_index()
 
         reverse = sort.startswith("-")
         key = sort.lstrip("-")
         if key not in {"created_at", "updated_at", "name"}:
             key = "created_at"
-        items.sort(key=lambda s: getattr(s, key), reverse=reverse)
-
-        total = len(items)
+        order = index.sorted_ids(key, reverse)
         limit = max(1, min(100, int(limit)))
         offset = max(0, int(offset))
-        return items[offset : offset + limit], total
+
+        if not (
+            tag
+            or visibility
+            or q
+            or created_after is not None
+            or created_before is not None
+        ):
+            page = order[offset : offset + limit]
+            return [index.items[sid] for sid in page], len(order)
+
+        # Narrow down via the exact-match indexes, smallest candidate set first
+        filters = []
+        if tag:
+            filters.append(index.by_tag.get(tag, {}))
+        if visibility:
+            filters.append(index.by_visibility.get(visibility, {}))
+        if filters:
+            filters.sort(key=len)
+            first, *rest = filters
+            ids = [sid for sid in first if all(sid in f for f in rest)]
+        else:
+            ids = list(index.items)
+
+        # Residual predicates on the candidates only
+        if q:
+            qq = q.lower()
+            ids = [sid for sid in ids if any(qq in t for t in index.text[sid])]
+        if created_after is not None:
+            ts = index.created_ts
+            ids = [sid for sid in ids if ts[sid] > created_after]
+        if created_before is not None:
+            ts = index.created_ts
+            ids = [sid for sid in ids if ts[sid] < created_before]
+
+        # Walk the presorted order and stop once the page is full
+        matched = set(ids)
+        page = islice((sid for sid in order if sid in matched), offset, offset + limit)
+        return [index.items[sid] for sid in page], len(matched)
 
     def delete(self, sid: UUID) -> bool:
         """Delete a custom scenario by ID. Presets cannot be deleted."""
-        with self._lock:
+        with self._writing():
             if sid in self._presets:
                 return False  # Cannot delete presets
 
-            scenarios = self._load_custom_scenarios()
-            original_len = len(scenarios)
-            scenarios = [s for s in scenarios if s.id != sid]
-            if len(scenarios) < original_len:
-                self._save_custom_scenarios(scenarios)
+            if self._items.pop(sid, None) is not None:
+                self._save_custom_scenarios()
                 return True
             return False
 
-    def save_idem(self, key: str, sid: UUID):
-        with self._lock:
-            self._idem[key] = sid
+    def save_idem(self, key: str, sid: UUID, body_hash: str):
+        with self._writing():
+            self._idem[key] = (sid, body_hash)
 
-    def get_idem(self, key: str) -> Optional[UUID]:
-        with self._lock:
-            return self._idem.get(key)
+    def get_idem(self, key: str) -> Optional[Tuple[UUID, str]]:
+        return self._read(lambda: self._idem.get(key))
 
 
 # Global Repository Instance
@@ -275,10 +434,7 @@ def _seed_presets():
             tags=["preset", "evacuation", "urban", "city", "intersection"],
             visibility="preset",
             seed=123,
-            sheep=[
-                (float(x), float(y))
-                for x, y in spawn_uniform(40, (50, 200, 200, 240), seed=123).tolist()
-            ],
+            sheep=spawn_uniform(40, (50, 200, 200, 240), seed=123).tolist(),
             drones=[
                 (30.0, 125.0),
                 (220.0, 125.0),
@@ -326,10 +482,7 @@ def _seed_presets():
             tags=["preset", "default", "uniform", "small"],
             visibility="preset",
             seed=42,
-            sheep=[
-                (float(x), float(y))
-                for x, y in spawn_uniform(50, (0, 200, 0, 200), seed=42).tolist()
-            ],
+            sheep=spawn_uniform(50, (0, 200, 0, 200), seed=42).tolist(),
             drones=[(0.0, 0.0)],
             targets=[],  # No default target
             boundary="none",
@@ -343,12 +496,7 @@ def _seed_presets():
             tags=["preset", "large", "clusters", "challenge"],
             visibility="preset",
             seed=7,
-            sheep=[
-                (float(x), float(y))
-                for x, y in spawn_clusters(
-                    200, 2, (0, 250, 0, 250), spread=3.5, seed=7
-                ).tolist()
-            ],
+            sheep=spawn_clusters(200, 2, (0, 250, 0, 250), spread=3.5, seed=7).tolist(),
             drones=[(125.0, 125.0)],
             targets=[],  # No default target
             boundary="none",
@@ -362,12 +510,7 @@ def _seed_presets():
             tags=["preset", "corners", "medium", "challenge"],
             visibility="preset",
             seed=3,
-            sheep=[
-                (float(x), float(y))
-                for x, y in spawn_corners(
-                    80, (0, 250, 0, 250), jitter=2.0, seed=3
-                ).tolist()
-            ],
+            sheep=spawn_corners(80, (0, 250, 0, 250), jitter=2.0, seed=3).tolist(),
             drones=[(125.0, 125.0)],
             targets=[],  # No default target
             boundary="none",
@@ -381,10 +524,7 @@ def _seed_presets():
             tags=["preset", "line", "medium"],
             visibility="preset",
             seed=5,
-            sheep=[
-                (float(x), float(y))
-                for x, y in spawn_line(60, (0, 250, 0, 250), seed=5).tolist()
-            ],
+            sheep=spawn_line(60, (0, 250, 0, 250), seed=5).tolist(),
             drones=[(0.0, 0.0)],
             targets=[],  # No default target
             boundary="none",
@@ -399,12 +539,9 @@ def _seed_presets():
             tags=["preset", "oil", "ocean", "cleanup"],
             visibility="preset",
             seed=99,
-            sheep=[
-                (float(x), float(y))
-                for x, y in spawn_clusters(
-                    100, 5, (0, 250, 0, 250), spread=20.0, seed=99
-                ).tolist()
-            ],
+            sheep=spawn_clusters(
+                100, 5, (0, 250, 0, 250), spread=20.0, seed=99
+            ).tolist(),
             drones=[(50.0, 50.0), (200.0, 50.0), (125.0, 200.0)],
             targets=[],
             boundary="none",
@@ -417,6 +554,7 @@ def _seed_presets():
     ]
 
     for preset in presets:
+        preset.to_json()  # presets never change; encode them ahead of requests
         REPO.add_preset(preset)
         print(f"✓ Created preset: {preset.name} ({len(preset.sheep)} sheep)")
 
@@ -425,7 +563,7 @@ def _seed_presets():
 _seed_presets()
 
 # Load persisted custom scenarios count
-_custom_count = len(REPO._load_custom_scenarios())
+_custom_count = len(REPO._items)
 print(
     f"Scenarios API ready with {len(REPO._presets)} presets + {_custom_count} custom scenarios"
 )
@@ -446,17 +584,43 @@ def _finite_pair(p) -> Vec2:
 
 
 def _normalize_points(pts) -> List[Vec2]:
-    return [_finite_pair(p) for p in (pts or [])]
+    """Validate a list of [x, y] points in one pass; returns [x, y] lists."""
+    if not pts:
+        return []
+    try:
+        arr = np.asarray(pts, dtype=np.float64)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError("coordinate must be [x, y]") from None
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError("coordinate must be [x, y]")
+    if not np.isfinite(arr).all():
+        raise ValueError("coordinate must be finite")
+    return arr.tolist()
 
 
 def _hash_body(d: dict) -> str:
-    return hashlib.sha256(
-        json.dumps(d, sort_keys=True, separators=(",", ":")).encode()
-    ).hexdigest()
+    """
+    Short digest of a request body's canonical (key-sorted) JSON.
+
+    Always uses the stdlib encoder, so the digest doesn't depend on whether
+    orjson is installed and any parsed JSON body (e.g. integers wider than 64
+    bits, in fields the API ignores) can be hashed.
+    """
+    body = json.dumps(d, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
 
+def _parse_timestamp(value: str) -> float:
+    """POSIX timestamp of an ISO-8601 string, taking naive times as UTC."""
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
-def _round_pts(pts: List[Vec2], nd=9) -> List[Vec2]:
-    return [(round(float(x), nd), round(float(y), nd)) for x, y in pts]
+
+def _round_pts(pts, nd=9) -> List[Vec2]:
+    """Round a point list or (N, 2) array; returns [x, y] lists."""
+    return np.round(np.asarray(pts, dtype=float).reshape(-1, 2), nd).tolist()
 
 
 # -----------------------------------------------------------------------------
@@ -525,11 +689,10 @@ def _spawn_entities(body: dict) -> Tuple[List[Vec2], List[Vec2], List[Vec2]]:
     else:
         raise ValueError(f"unknown spawn.kind '{kind}'")
 
-    sheep = [(float(x), float(y)) for x, y in sheep_xy.tolist()]
-
     # Drones
     drones_in = spawn.get("drones") or []
     drones_list: List[Vec2] = []
+    rng = None  # one generator per request, created on first "around" group
     for d in drones_in:
         if "position" in d:
             drones_list.append(_finite_pair(d["position"]))
@@ -537,18 +700,19 @@ def _spawn_entities(body: dict) -> Tuple[List[Vec2], List[Vec2], List[Vec2]]:
             around = _finite_pair(d["around"])
             count = int(d.get("count", 1))
             r = float(d["radius"])
-            rng = np.random.default_rng(seed)
-            th = rng.random(count) * 2 * np.pi
+            if rng is None:
+                rng = np.random.default_rng(seed)
+            th = rng.uniform(0.0, 2 * np.pi, count)
             xs = around[0] + r * np.cos(th)
             ys = around[1] + r * np.sin(th)
-            drones_list.extend([(float(x), float(y)) for x, y in zip(xs, ys)])
+            drones_list.extend(np.column_stack([xs, ys]).tolist())
         else:
             # fallback: center
             drones_list.append(((xmin + xmax) / 2.0, (ymin + ymax) / 2.0))
 
     targets = _normalize_points(spawn.get("targets") or [])
 
-    return _round_pts(sheep), _round_pts(drones_list), _round_pts(targets)
+    return _round_pts(sheep_xy), _round_pts(drones_list), _round_pts(targets)
 
 
 # -----------------------------------------------------------------------------
@@ -558,79 +722,108 @@ def _spawn_entities(body: dict) -> Tuple[List[Vec2], List[Vec2], List[Vec2]]:
 scenarios_bp = Blueprint("scenarios", __name__, url_prefix="/scenarios")
 
 
+def _json_response(obj, status: int = 200, headers=None) -> Response:
+    """Serialize obj with _dumps into a JSON response."""
+    return Response(
+        _dumps(obj), status=status, headers=headers, mimetype="application/json"
+    )
+
+
+def _scenario_response(s: Scenario, status: int) -> Response:
+    """JSON response for a single scenario; 201s carry its Location."""
+    headers = {"Location": f"/scenarios/{s.id}"} if status == 201 else None
+    return Response(
+        s.to_json(), status=status, headers=headers, mimetype="application/json"
+    )
+
+
+def _stream_list(
+    items: List[Scenario], total: int, limit: int, offset: int
+) -> Iterator[bytes]:
+    """
+    Emit a list response chunk by chunk from the per-scenario encodings.
+
+    Keys come out in sorted order, as in every other response; nothing larger
+    than one scenario is ever joined in memory.
+    """
+    yield b'{"items":['
+    for i, s in enumerate(items):
+        if i:
+            yield b","
+        yield s.to_json()
+    yield b'],"limit":%d,"offset":%d,"total":%d}' % (limit, offset, total)
+
+
 @scenarios_bp.route("", methods=["POST"])
 def create_scenario() -> Any:
     try:
         body = request.get_json(force=True, silent=False) or {}
     except Exception:
-        return (
-            jsonify({"error": {"type": "BadRequest", "message": "Invalid JSON"}}),
-            400,
+        return _json_response(
+            {"error": {"type": "BadRequest", "message": "Invalid JSON"}}, 400
         )
 
     if not isinstance(body, dict):
-        return (
-            jsonify(
-                {
-                    "error": {
-                        "type": "BadRequest",
-                        "message": "JSON body must be an object",
-                    }
+        return _json_response(
+            {
+                "error": {
+                    "type": "BadRequest",
+                    "message": "JSON body must be an object",
                 }
-            ),
+            },
             400,
         )
 
     idem_key = request.headers.get("Idempotency-Key")
+    body_hash = None
     if idem_key:
-        sid_existing = REPO.get_idem(idem_key)
-        if sid_existing:
+        body_hash = _hash_body(body)
+        idem = REPO.get_idem(idem_key)
+        if idem:
+            sid_existing, hash_existing = idem
+            if hash_existing != body_hash:
+                return _json_response(
+                    {
+                        "error": {
+                            "type": "Conflict",
+                            "message": "Idempotency-Key was already used with a different body",
+                        }
+                    },
+                    409,
+                )
             existing = REPO.get(sid_existing)
             if existing:
-                return (
-                    jsonify(asdict(existing)),
-                    201,
-                    {"Location": f"/scenarios/{existing.id}"},
-                )
+                return _scenario_response(existing, 201)
 
     name = str(body.get("name", "")).strip()
     if not name:
-        return (
-            jsonify({"error": {"type": "Validation", "message": "'name' is required"}}),
-            422,
+        return _json_response(
+            {"error": {"type": "Validation", "message": "'name' is required"}}, 422
         )
 
     description = body.get("description")
     tags = [str(t).strip().lower() for t in (body.get("tags") or []) if str(t).strip()]
     visibility = body.get("visibility", "private")
     if visibility not in ("private", "public", "preset"):
-        return (
-            jsonify(
-                {"error": {"type": "Validation", "message": "invalid 'visibility'"}}
-            ),
-            422,
+        return _json_response(
+            {"error": {"type": "Validation", "message": "invalid 'visibility'"}}, 422
         )
 
     w = body.get("world") or {}
     boundary = w.get("boundary", "none")
     if boundary not in ("none", "wrap", "reflect"):
-        return (
-            jsonify(
-                {"error": {"type": "Validation", "message": "invalid world.boundary"}}
-            ),
-            422,
+        return _json_response(
+            {"error": {"type": "Validation", "message": "invalid world.boundary"}}, 422
         )
     bounds = tuple(w.get("bounds", (0.0, 250.0, 0.0, 250.0)))
     if len(bounds) != 4:
-        return (
-            jsonify(
-                {
-                    "error": {
-                        "type": "Validation",
-                        "message": "world.bounds must be [xmin,xmax,ymin,ymax]",
-                    }
+        return _json_response(
+            {
+                "error": {
+                    "type": "Validation",
+                    "message": "world.bounds must be [xmin,xmax,ymin,ymax]",
                 }
-            ),
+            },
             422,
         )
     seed = w.get("seed")
@@ -638,7 +831,9 @@ def create_scenario() -> Any:
     try:
         sheep, drones, targets = _spawn_entities(body)
     except ValueError as ex:
-        return jsonify({"error": {"type": "Validation", "message": str(ex)}}), 422
+        return _json_response(
+            {"error": {"type": "Validation", "message": str(ex)}}, 422
+        )
 
     s = Scenario(
         id=uuid4(),
@@ -664,9 +859,9 @@ def create_scenario() -> Any:
 
     REPO.create(s)
     if idem_key:
-        REPO.save_idem(idem_key, s.id)
+        REPO.save_idem(idem_key, s.id, body_hash)
 
-    return jsonify(asdict(s)), 201, {"Location": f"/scenarios/{s.id}"}
+    return _scenario_response(s, 201)
 
 
 @scenarios_bp.route("", methods=["GET"])
@@ -675,15 +870,26 @@ def list_scenarios() -> Any:
     tag = request.args.get("tag")
     visibility = request.args.get("visibility")
     if visibility not in (None, "private", "public", "preset"):
-        return (
-            jsonify(
-                {"error": {"type": "Validation", "message": "invalid 'visibility'"}}
-            ),
-            422,
+        return _json_response(
+            {"error": {"type": "Validation", "message": "invalid 'visibility'"}}, 422
         )
 
     created_after = request.args.get("created_after")
     created_before = request.args.get("created_before")
+    try:
+        after_ts = _parse_timestamp(created_after) if created_after else None
+        before_ts = _parse_timestamp(created_before) if created_before else None
+    except ValueError:
+        return _json_response(
+            {
+                "error": {
+                    "type": "Validation",
+                    "message": "created_after/created_before must be ISO-8601 timestamps",
+                }
+            },
+            422,
+        )
+
     sort = request.args.get("sort", "-created_at")
     limit = int(request.args.get("limit", 20))
     offset = int(request.args.get("offset", 0))
@@ -692,23 +898,15 @@ def list_scenarios() -> Any:
         q=q,
         tag=tag,
         visibility=visibility,  # type: ignore
-        created_after=created_after,
-        created_before=created_before,
+        created_after=after_ts,
+        created_before=before_ts,
         sort=sort,
         limit=limit,
         offset=offset,
     )
 
-    return (
-        jsonify(
-            {
-                "items": [asdict(s) for s in items],
-                "total": total,
-                "limit": limit,
-                "offset": offset,
-            }
-        ),
-        200,
+    return Response(
+        _stream_list(items, total, limit, offset), mimetype="application/json"
     )
 
 
@@ -716,8 +914,7 @@ def list_scenarios() -> Any:
 def get_scenario(sid: UUID) -> Any:
     s = REPO.get(sid)
     if not s:
-        return (
-            jsonify({"error": {"type": "NotFound", "message": "scenario not found"}}),
-            404,
+        return _json_response(
+            {"error": {"type": "NotFound", "message": "scenario not found"}}, 404
         )
-    return jsonify(asdict(s)), 200
+    return _scenario_response(s, 200)
@@ -32,11 +32,13 @@ def spawn_uniform(
     rng = np.random.default_rng(seed)
     xmin, xmax, ymin, ymax = bounds
 
-    # Add a small buffer from the edges
-    x = rng.uniform(xmin + 1, xmax - 1, N)
-    y = rng.uniform(ymin + 1, ymax - 1, N)
+    # Add a small buffer from the edges. Each axis is drawn straight into its
+    # column of a C-ordered result (the layout the Numba kernels expect).
+    pts = np.empty((N, 2))
+    pts[:, 0] = rng.uniform(xmin + 1, xmax - 1, N)
+    pts[:, 1] = rng.uniform(ymin + 1, ymax - 1, N)
 
-    return np.stack([x, y], axis=1)
+    return pts
 
 
 def spawn_clusters(
@@ -67,18 +69,18 @@ def spawn_clusters(
         [rng.uniform(xmin + 6, xmax - 6, k), rng.uniform(ymin + 6, ymax - 6, k)], axis=1
     )
 
-    pts = []
     base = N // k
     extras = N - base * k
 
     # Distribute points among clusters
     sizes = [base + (1 if i < extras else 0) for i in range(k)]
 
-    for i, c in enumerate(centers):
-        cov = np.eye(2) * (spread**2)
-        pts.append(rng.multivariate_normal(c, cov, sizes[i]))
-
-    return np.vstack(pts)
+    # Isotropic clusters: one batch of standard normals, scaled and shifted
+    # onto each point's center (the same draws multivariate_normal would make)
+    pts = rng.standard_normal((N, 2))
+    pts *= spread
+    pts += np.repeat(centers, sizes, axis=0)
+    return pts
 
 
 def spawn_corners(
@@ -112,12 +114,16 @@ def spawn_corners(
         dtype=float,
     )
 
-    pts = []
-    for i in range(N):
-        c = corners[i % 4]
-        pts.append(c + rng.normal(scale=jitter, size=2))
-
-    return np.array(pts)
+    # Points cycle through the corners; noise is drawn in one batch and the
+    # corners are added in place, four rows at a time, without an index array
+    if jitter < 0:
+        raise ValueError("jitter must be non-negative")
+    pts = rng.standard_normal((N, 2))
+    pts *= jitter
+    full = N - N % 4
+    pts[:full].reshape(-1, 4, 2)[...] += corners
+    pts[full:] += corners[: N - full]
+    return pts
 
 
 def spawn_line(
@@ -169,7 +175,14 @@ def spawn_circle(
     c = np.array(center, float)
 
     # Generate random angles and radii (sqrt for uniform area distribution)
-    th = rng.random(N) * 2 * np.pi
-    r = radius * np.sqrt(rng.random(N))
-
-    return c + np.stack([r * np.cos(th), r * np.sin(th)], axis=1)
+    th = rng.uniform(0.0, 2 * np.pi, N)
+    r = np.sqrt(rng.random(N))
+    r *= radius
+
+    # Fill the (N, 2) result in place rather than stacking temporaries
+    pts = np.empty((N, 2))
+    np.cos(th, out=pts[:, 0])
+    np.sin(th, out=pts[:, 1])
+    pts *= r[:, None]
+    pts += c
+    return pts
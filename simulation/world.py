@@ -19,11 +19,12 @@ from planning.plan_type import DoNothing, DronePositions, Plan
 # -----------------------------------------------------------------------------
 
 try:
-    from numba import njit
+    from numba import njit, prange
 
     NUMBA_AVAILABLE = True
 except ImportError:
     NUMBA_AVAILABLE = False
+    prange = range
 
     def njit(*args, **kwargs):
         def decorator(func):
@@ -115,9 +116,17 @@ class World:
         self.target = np.asarray(target_xy, float) if target_xy is not None else None
         self.paused = False
 
+        # Last get_state_view() result and the arrays it was built from; views
+        # are reused while those arrays are still the world's current ones
+        self._state_view: state.State | None = None
+        self._state_view_src: tuple | None = None
+
         # Polygon obstacles
         self.polys: list[np.ndarray] = []
         self.poly_edges: list[dict] = []
+        # Flattened per-segment edge data for every polygon, rebuilt lazily
+        # after the polygon set changes (see _segment_cache)
+        self._segments: tuple[np.ndarray, np.ndarray] | None = None
         if obstacles_polygons is not None:
             for poly in obstacles_polygons:
                 self.add_polygon(poly)
@@ -215,16 +224,71 @@ class World:
 
         self.polys.append(poly)
         self.poly_edges.append(self._precompute_polygon_edges(poly))
+        self._segments = None
+
+    def add_polygons(self, polygons: list[np.ndarray] | np.ndarray) -> None:
+        """
+        Add multiple polygon obstacles.
 
-    def add_polygons(self, polygons: list[np.ndarray]) -> None:
-        """Add multiple polygon obstacles."""
+        A (K, N, 2) array of equal-length polygons is oriented and has its edge
+        data precomputed in one vectorized pass instead of polygon by polygon.
+        """
+        if isinstance(polygons, np.ndarray) and polygons.ndim == 3:
+            self._add_polygon_batch(polygons)
+            return
         for poly in polygons:
             self.add_polygon(poly)
 
+    def _add_polygon_batch(self, polygons: np.ndarray) -> None:
+        """Batched add_polygon for a (K, N, 2) array."""
+        V = np.asarray(polygons, float)
+        x = V[:, :, 0]
+        y = V[:, :, 1]
+        area = 0.5 * np.sum(
+            x * np.roll(y, -1, axis=1) - np.roll(x, -1, axis=1) * y, axis=1
+        )
+        # Ensure CCW winding per polygon
+        V = np.where((area < 0)[:, None, None], V[:, ::-1], V)
+
+        E = np.roll(V, -1, axis=1) - V
+        L = np.sqrt(np.sum(E**2, axis=2))
+        N = np.stack([E[:, :, 1], -E[:, :, 0]], axis=-1)
+        nonzero_mask = L > EPSILON
+        N[nonzero_mask] /= L[nonzero_mask][:, None]
+
+        for k in range(V.shape[0]):
+            self.polys.append(V[k])
+            self.poly_edges.append({"V": V[k], "E": E[k], "N": N[k], "L": L[k]})
+        self._segments = None
+
     def clear_polygons(self) -> None:
         """Remove all polygon obstacles."""
         self.polys = []
         self.poly_edges = []
+        self._segments = None
+
+    def _segment_cache(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return every polygon edge as one (M, 9) float64 table plus polygon offsets.
+
+        Columns are (x1, y1, x2, y2, ex, ey, length, nx, ny); segments of
+        polygon k occupy rows offsets[k]:offsets[k + 1].
+        """
+        if self._segments is None:
+            rows = []
+            for edges in self.poly_edges:
+                V = edges["V"]
+                rows.append(
+                    np.column_stack(
+                        [V, np.roll(V, -1, axis=0), edges["E"], edges["L"], edges["N"]]
+                    )
+                )
+            sizes = [r.shape[0] for r in rows]
+            offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum(sizes, out=offsets[1:])
+            table = np.ascontiguousarray(np.concatenate(rows), dtype=np.float64)
+            self._segments = (table, offsets)
+        return self._segments
 
     def get_polygons(self) -> list[np.ndarray]:
         """Get current polygon obstacles."""
@@ -279,23 +343,23 @@ class World:
             count = 1  # Minimum 1 drone
 
         if count > current_count:
-            # Add more drones - spawn them near existing drones
-            new_drones = []
-            for i in range(count - current_count):
-                if current_count == 0:
-                    ref_pos = np.array([0, 0])
-                else:
-                    # Pick a random existing drone to spawn near
-                    ref_idx = i % current_count
-                    ref_pos = self.drones[ref_idx]
-                # Offset by small random amount
-                offset = self.rng.uniform(-10, 10, size=2)
-                new_pos = ref_pos + offset
-                # Clamp to bounds
-                new_pos[0] = np.clip(new_pos[0], self.xmin + 5, self.xmax - 5)
-                new_pos[1] = np.clip(new_pos[1], self.ymin + 5, self.ymax - 5)
-                new_drones.append(new_pos)
-            self.drones = np.vstack([self.drones, new_drones])
+            # Add more drones - spawn them near existing drones (round-robin),
+            # all at once: one offset draw, one clamp, one concatenation
+            n_new = count - current_count
+            if current_count == 0:
+                ref_pos = np.zeros((n_new, 2))
+            else:
+                ref_pos = self.drones[np.arange(n_new) % current_count]
+            # Offset by small random amount
+            new_drones = ref_pos + self.rng.uniform(-10, 10, size=(n_new, 2))
+            # Clamp to bounds
+            np.clip(
+                new_drones,
+                (self.xmin + 5, self.ymin + 5),
+                (self.xmax - 5, self.ymax - 5),
+                out=new_drones,
+            )
+            self.drones = np.concatenate([self.drones, new_drones])
             # Extend apply_repulsion array
             self.apply_repulsion = np.ones(self.drones.shape[0], dtype=bool)
         else:
@@ -404,6 +468,10 @@ class World:
                 np.full(P.shape[0], np.inf),
             )
 
+        if NUMBA_AVAILABLE:
+            segments, offsets = self._segment_cache()
+            return _nearest_segment_numba(P, segments, offsets)
+
         n_points = P.shape[0]
         best_Q = np.zeros((n_points, 2))
         best_n = np.zeros((n_points, 2))
@@ -618,6 +686,25 @@ class World:
             idx = idx[d2[idx] > 0]
             return idx[:K]
 
+    def _kNN_all(self, K: int, rows: np.ndarray | None = None) -> np.ndarray:
+        """
+        k-nearest neighbors of many sheep in one pass, shape (len(rows), K).
+
+        Each row lists neighbors nearest first, like _kNN_vec; rows defaults to
+        every sheep. Only the sheep itself is excluded: sheep stacked on the
+        same spot count as neighbors at distance 0, as in _kNN_numba. This
+        differs on purpose from _kNN_vec's NumPy fallback, which drops them
+        and can return fewer than K, while every nb_idx row needs exactly K.
+        """
+        P = self.P
+        rows = np.arange(self.N) if rows is None else np.asarray(rows)
+        diff = P[rows, None, :] - P[None, :, :]
+        d2 = np.einsum("ijk,ijk->ij", diff, diff)
+        d2[np.arange(rows.size), rows] = np.inf
+        near = np.argpartition(d2, K - 1, axis=1)[:, :K]
+        order = np.take_along_axis(d2, near, axis=1).argsort(axis=1, kind="stable")
+        return np.take_along_axis(near, order, axis=1)
+
     def _repel_close_vec(self, i: int) -> np.ndarray:
         """Vectorized repulsion from close neighbors using contiguous arrays."""
         if NUMBA_AVAILABLE:
@@ -633,6 +720,12 @@ class World:
             vecs = -(d_vec * inv_d[:, None])
             return vecs.sum(axis=0)
 
+    def _repel_close_all(self) -> np.ndarray:
+        """Close-neighbor repulsion for every sheep at once, shape (N, 2)."""
+        if NUMBA_AVAILABLE:
+            return _repel_close_all_numba(self.P, self.ra)
+        return np.array([self._repel_close_vec(i) for i in range(self.N)])
+
     def _neighbors_within(
         self, i: int, r_sq: float, max_k: int | None = None
     ) -> np.ndarray:
@@ -716,7 +809,17 @@ class World:
             V += displacement / (self.dt + 1e-12)
             return
 
-        # Reflection boundaries
+        # Reflection boundaries; with every sheep inside there is nothing to
+        # reflect, so skip the masks, the copy and the displacement pass
+        x, y = P[:, 0], P[:, 1]
+        if (
+            x.min() >= self.xmin
+            and x.max() <= self.xmax
+            and y.min() >= self.ymin
+            and y.max() <= self.ymax
+        ):
+            return
+
         P_before = P.copy()
 
         m = P[:, 0] < self.xmin
@@ -821,8 +924,12 @@ class World:
         self.flock += change_in_flocking
         self.flock = np.clip(self.flock, 0.0, 1.0)
 
-        v_far = self._handle_far_sheep(G)
-        v_near = self._handle_near_sheep(G, drone_distances_sq)
+        # Both behaviors read the same pre-step positions, so the O(N^2)
+        # repulsion pass runs once per step instead of twice per sheep.
+        R_all = self._repel_close_all()
+        obstacles = self._obstacle_avoid(self.P)
+        v_far = self._handle_far_sheep(G, R_all, obstacles)
+        v_near = self._handle_near_sheep(G, drone_distances_sq, R_all, obstacles)
 
         # Blend near and far behaviors based on flocking factor
         v_new = (
@@ -844,27 +951,24 @@ class World:
             self.P[bad] = np.array([cx, cy])
             self.V[bad] = 0.0
 
-    def _handle_far_sheep(self, G: np.ndarray) -> np.ndarray:
+    def _handle_far_sheep(
+        self, G: np.ndarray, R_all: np.ndarray, obstacles: tuple
+    ) -> np.ndarray:
         """Handle sheep that are far from the drone (grazing behavior)."""
         decay = 0.80
+        avoid, tan, s = obstacles
 
         V_new = np.zeros((self.N, 2))
         for i in range(self.N):
             rnd = self.rng.normal(size=2) * 0.2
-            R = self._repel_close_vec(i)
+            R = R_all[i]
             H = self.wr * R + rnd
 
             h = norm(H)
 
             # Obstacle handling for far sheep
-            if self.polys:
-                avoid_far, tan_far, s_far = self._obstacle_avoid(self.P[i : i + 1])
-                nrm_f = avoid_far[0]
-                tng_f = tan_far[0]
-            else:
-                nrm_f = np.zeros(2)
-                tng_f = np.zeros(2)
-                s_far = np.array([np.inf])
+            nrm_f = avoid[i]
+            tng_f = tan[i]
 
             H = h.copy()
 
@@ -873,7 +977,7 @@ class World:
 
             H += (0.5 * self.w_obs) * nrm_f
 
-            if s_far[0] <= self.keep_out:
+            if s[i] <= self.keep_out:
                 n_unit = nrm_f
                 L = np.sqrt(np.dot(n_unit, n_unit)) + 1e-12
                 n_unit = n_unit / L
@@ -896,16 +1000,14 @@ class World:
         return V_new
 
     def _handle_near_sheep(
-        self, G: np.ndarray, drone_distances_sq: np.ndarray
+        self,
+        G: np.ndarray,
+        drone_distances_sq: np.ndarray,
+        R_all: np.ndarray,
+        obstacles: tuple,
     ) -> np.ndarray:
         """Handle sheep that are near a drone (flocking behavior)."""
-
-        if self.polys:
-            avoid, tan, s = self._obstacle_avoid(self.P)
-        else:
-            avoid = np.zeros((self.N, 2))
-            tan = np.zeros((self.N, 2))
-            s = np.full(self.N, np.inf)
+        avoid, tan, s = obstacles
 
         nrm = avoid
         tng = tan
@@ -928,7 +1030,7 @@ class World:
         V_new = np.zeros((self.N, 2))
         for i in range(self.N):
 
-            R = self._repel_close_vec(i)
+            R = R_all[i]
             A = self._lcm_vec(i) - self.P[i]
             S = S_total[i]
             AL = self._align_vec(i)
@@ -1036,6 +1138,41 @@ class World:
             jobs=[],
         )
 
+    def get_state_view(self) -> state.State:
+        """
+        Get a read-only, zero-copy view of the current simulation state.
+
+        The arrays alias the world's buffers, so the view is only valid until
+        the next step(); use get_state() for a snapshot that must outlive it.
+        Views whose underlying array has not been rebound since the previous
+        call are reused, so a planned step only rebuilds the drone view.
+        """
+        P, drones, polys = self.P, self.drones, self.polys
+        src = self._state_view_src
+        if src is None:
+            flock_v, drones_v, polys_v = None, None, None
+        else:
+            view = self._state_view
+            flock_v = view.flock if src[0] is P else None
+            drones_v = view.drones if src[1] is drones else None
+            polys_v = (
+                view.polygons
+                if len(src[2]) == len(polys)
+                and all(a is b for a, b in zip(src[2], polys))
+                else None
+            )
+            if flock_v is not None and drones_v is not None and polys_v is not None:
+                return view
+
+        self._state_view = state.State(
+            flock=_readonly_view(P) if flock_v is None else flock_v,
+            drones=_readonly_view(drones) if drones_v is None else drones_v,
+            polygons=[_readonly_view(p) for p in polys] if polys_v is None else polys_v,
+            jobs=[],
+        )
+        self._state_view_src = (P, drones, tuple(polys))
+        return self._state_view
+
     def pause(self):
         """Toggle simulation pause state."""
         self.paused = not self.paused
@@ -1058,18 +1195,24 @@ class World:
         if not np.any(need):
             return
         idxs = np.where(need)[0]
-        # Use fast NumPy argpartition path for kNN refresh to minimize overhead
-        for i in idxs:
-            self.nb_idx[i, : self.k_nn] = self._kNN_vec(i, self.k_nn)
+        # One batched distance pass over all rows needing a refresh
+        self.nb_idx[idxs, : self.k_nn] = self._kNN_all(self.k_nn, idxs)
         self.prev_P[need] = self.P[need]
 
 
+def _readonly_view(arr: np.ndarray) -> np.ndarray:
+    """Return a non-writeable view sharing arr's memory."""
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
 # -----------------------------------------------------------------------------
 # Numba Optimized Functions
 # -----------------------------------------------------------------------------
 
 
-@njit
+@njit(cache=True)
 def _point_in_poly_batch_numba(P: np.ndarray, V: np.ndarray) -> np.ndarray:
     """Numba-optimized batch point-in-polygon test using ray casting."""
     n_points = P.shape[0]
@@ -1094,7 +1237,7 @@ def _point_in_poly_batch_numba(P: np.ndarray, V: np.ndarray) -> np.ndarray:
     return inside
 
 
-@njit
+@njit(cache=True)
 def _closest_point_on_polygon_numba(
     P: np.ndarray, V: np.ndarray, E: np.ndarray, L: np.ndarray
 ) -> tuple:
@@ -1151,7 +1294,7 @@ def _closest_point_on_polygon_numba(
     return Q, n, s
 
 
-@njit
+@njit(cache=True)
 def _kNN_numba(P: np.ndarray, i: int, K: int) -> np.ndarray:
     """Numba-optimized k-nearest neighbors using argsort."""
     N = P.shape[0]
@@ -1167,7 +1310,7 @@ def _kNN_numba(P: np.ndarray, i: int, K: int) -> np.ndarray:
     return sorted_indices[:K]
 
 
-@njit
+@njit(cache=True)
 def _repel_close_numba(P: np.ndarray, i: int, ra: float) -> np.ndarray:
     """Numba-optimized repulsion calculation using squared distances."""
     repulsion = np.zeros(2, dtype=np.float64)
@@ -1189,3 +1332,103 @@ def _repel_close_numba(P: np.ndarray, i: int, ra: float) -> np.ndarray:
             repulsion[1] += dy * inv_d
 
     return repulsion
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _repel_close_all_numba(P: np.ndarray, ra: float) -> np.ndarray:
+    """Numba-optimized repulsion for all sheep, parallel over the sheep index."""
+    N = P.shape[0]
+    ra_sq = ra * ra
+    out = np.zeros((N, 2), dtype=np.float64)
+
+    for i in prange(N):
+        px = P[i, 0]
+        py = P[i, 1]
+        rx = 0.0
+        ry = 0.0
+        for j in range(N):
+            if i == j:
+                continue
+
+            dx = px - P[j, 0]
+            dy = py - P[j, 1]
+            d_sq = dx * dx + dy * dy
+
+            if d_sq > 1e-18 and d_sq < ra_sq:
+                inv_d = 1.0 / (np.sqrt(d_sq) + 1e-9)
+                rx += dx * inv_d
+                ry += dy * inv_d
+        out[i, 0] = rx
+        out[i, 1] = ry
+
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _nearest_segment_numba(
+    P: np.ndarray, segments: np.ndarray, offsets: np.ndarray
+) -> tuple:
+    """
+    Numba-optimized nearest polygon boundary over a flattened segment table.
+
+    Scans all segments of all polygons per point, then signs the distance with
+    a ray-casting test against the owning polygon only.
+    """
+    n_points = P.shape[0]
+    n_segments = segments.shape[0]
+    n_polys = offsets.shape[0] - 1
+
+    Q = np.zeros((n_points, 2), dtype=np.float64)
+    n = np.zeros((n_points, 2), dtype=np.float64)
+    s = np.full(n_points, np.inf)
+
+    for i in prange(n_points):
+        px = P[i, 0]
+        py = P[i, 1]
+        best = np.inf
+        best_k = -1
+        best_t = 0.0
+        for k in range(n_segments):
+            ex = segments[k, 4]
+            ey = segments[k, 5]
+            L = segments[k, 6]
+            tx = px - segments[k, 0]
+            ty = py - segments[k, 1]
+            if L > EPSILON:
+                t = max(0.0, min(1.0, (tx * ex + ty * ey) / (L * L)))
+            else:
+                t = 0.0
+            dx = px - (segments[k, 0] + t * ex)
+            dy = py - (segments[k, 1] + t * ey)
+            d_sq = dx * dx + dy * dy
+            if d_sq < best:
+                best = d_sq
+                best_k = k
+                best_t = t
+
+        if best_k < 0:
+            continue
+
+        Q[i, 0] = segments[best_k, 0] + best_t * segments[best_k, 4]
+        Q[i, 1] = segments[best_k, 1] + best_t * segments[best_k, 5]
+        n[i, 0] = segments[best_k, 7]
+        n[i, 1] = segments[best_k, 8]
+        s[i] = np.sqrt(best)
+
+        # Ray-cast against the owning polygon to sign the distance
+        poly = 0
+        while poly < n_polys - 1 and offsets[poly + 1] <= best_k:
+            poly += 1
+        inside = False
+        for k in range(offsets[poly], offsets[poly + 1]):
+            xi, yi = segments[k, 2], segments[k, 3]
+            xj, yj = segments[k, 0], segments[k, 1]
+            denom = yj - yi
+            if ((yi > py) != (yj > py)) and (
+                px < (xj - xi) * (py - yi) / (denom + 1e-12) + xi
+            ):
+                inside = not inside
+        if inside:
+            s[i] = -s[i]
+
+    return Q, n, s
@@ -154,3 +154,42 @@ def test_obstacle_avoidance_flow():
     # Verify progress (should have moved right, maybe around obstacle)
     final_mean_x = np.mean(w.P[:, 0])
     assert final_mean_x > 50.0, "Flock failed to move right"
+
+
+def test_plan_and_step_n_matches_manual_loop():
+    """plan_and_step_n advances a world exactly like per-substep plan/step."""
+    seed = 7
+    sheep_xy = scenarios.spawn_circle(20, center=(50, 50), radius=10.0, seed=seed)
+    drone_xy = np.array([[40.0, 40.0]])
+    target_pos = np.array([150.0, 150.0])
+    job = state.Job(
+        target=state.Circle(center=target_pos, radius=15.0),
+        drone_count=1,
+        status="running",
+        is_active=True,
+        remaining_time=None,
+        start_at=None,
+        completed_at=None,
+        scenario_id="e2e-test",
+        maintain_until="target_is_reached",
+        created_at=0,
+        updated_at=0,
+    )
+
+    def make_world():
+        return world.World(sheep_xy, drone_xy, target_xy=target_pos, seed=seed, k_nn=10)
+
+    fused, manual = make_world(), make_world()
+    pol = policy.ShepherdPolicy(
+        fN=20.0,
+        umax=fused.umax,
+        too_close=1.5 * fused.ra,
+        collect_standoff=1.0 * fused.ra,
+    )
+
+    pol.plan_and_step_n(fused, [job], 15)
+    for _ in range(15):
+        manual.step(pol.plan(manual.get_state(), [job], manual.dt))
+
+    np.testing.assert_array_equal(fused.P, manual.P)
+    np.testing.assert_array_equal(fused.drones, manual.drones)
@@ -119,3 +119,102 @@ def test_polygon_target():
     assert isinstance(plan, plan_type.DronePositions)
     # Should produce valid positions
     assert np.isfinite(plan.positions).all()
+
+
+def test_goal_satisfied_batch_matches_scalar():
+    """Batched goal check agrees with is_goal_satisfied for every target."""
+    flock = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 1.0]])
+    w = state.State(flock=flock, drones=np.zeros((1, 2)), polygons=[], jobs=[])
+    targets = [
+        state.Circle(center=np.array([2.0, 1.5]), radius=2.0),
+        state.Circle(center=np.array([50.0, 50.0]), radius=5.0),
+        state.Circle(center=np.array([2.0, 1.5]), radius=None),
+        state.Polygon(
+            points=np.array([[0.0, 0.0], [5.0, 0.0], [5.0, 5.0], [0.0, 5.0]])
+        ),
+    ]
+
+    batch = policy.is_goal_satisfied_batch(w, targets)
+
+    assert batch.tolist() == [policy.is_goal_satisfied(w, t) for t in targets]
+    assert batch.tolist() == [True, False, False, True]
+
+
+def test_goal_features_shortcut_matches_exact_check():
+    """Centroid/spread shortcuts never change the goal check result."""
+    rng = np.random.default_rng(0)
+    flock = rng.uniform(-10.0, 10.0, size=(40, 2))
+    w = state.State(flock=flock, drones=np.zeros((1, 2)), polygons=[], jobs=[])
+    features = policy.compute_goal_features(w)
+    targets = [
+        state.Circle(center=np.array([cx, 0.0]), radius=r)
+        for cx in (0.0, 5.0, 40.0)
+        for r in (5.0, 14.0, 30.0)
+    ]
+
+    batch = policy.is_goal_satisfied_batch(w, targets, features)
+
+    assert batch.tolist() == [policy.is_goal_satisfied(w, t) for t in targets]
+
+
+def test_goal_not_satisfied_with_nan_positions():
+    """A flock with a NaN position never counts as inside a target."""
+    flock = np.array([[1.0, 1.0], [np.nan, 2.0], [3.0, 1.0]])
+    w = state.State(flock=flock, drones=np.zeros((1, 2)), polygons=[], jobs=[])
+    target = state.Circle(center=np.array([2.0, 1.5]), radius=50.0)
+
+    assert not policy.is_goal_satisfied(w, target)
+    assert policy.is_goal_satisfied_batch(w, [target]).tolist() == [False]
+    features = policy.compute_goal_features(w)
+    assert policy.is_goal_satisfied_batch(w, [target], features).tolist() == [False]
+
+
+def test_prepared_context_matches_plan():
+    """step_control with a prepared context reproduces plan()."""
+    rng = np.random.default_rng(1)
+    flock = rng.uniform(0.0, 50.0, size=(20, 2))
+    drones = np.array([[0.0, 0.0], [10.0, 10.0]])
+    target = state.Circle(center=np.array([100.0, 100.0]), radius=10.0)
+    idle = state.Job(
+        target=state.Circle(center=np.array([-50.0, -50.0]), radius=5.0),
+        drone_count=2,
+        status="pending",
+        is_active=False,
+        remaining_time=None,
+        start_at=None,
+        completed_at=None,
+        scenario_id=None,
+        maintain_until="target_is_reached",
+        created_at=0,
+        updated_at=0,
+    )
+    active = state.Job(
+        target=target,
+        drone_count=2,
+        status="running",
+        is_active=True,
+        remaining_time=None,
+        start_at=None,
+        completed_at=None,
+        scenario_id=None,
+        maintain_until="target_is_reached",
+        created_at=0,
+        updated_at=0,
+    )
+    s = state.State(flock=flock, drones=drones, polygons=[], jobs=[])
+    pol = policy.ShepherdPolicy(fN=20.0, umax=2.0, too_close=10.0, collect_standoff=5.0)
+
+    ctx = pol.prepare([idle, active])
+    assert ctx.target is target
+    assert pol.prepare([idle]).target is None
+
+    expected = pol.plan(s, [idle, active], dt=1.0)
+    got = pol.step_control(s, ctx, dt=1.0)
+    np.testing.assert_array_equal(got.positions, expected.positions)
+    assert got.target_sheep_indices == expected.target_sheep_indices
+
+
+def test_policy_target_radius_default():
+    """The generated-target radius is derived once from fN."""
+    pol = policy.ShepherdPolicy(fN=20.0, umax=2.0, too_close=10.0, collect_standoff=5.0)
+    assert pol.target_radius_default == 20.0 * policy.TARGET_RADIUS_FN_MULTIPLIER
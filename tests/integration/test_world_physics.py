@@ -154,3 +154,132 @@ def test_empty_world():
     # World requires N > k_nn, so N=0 should raise AssertionError
     with pytest.raises(AssertionError):
         world.World(sheep_xy, drone_xy, None, seed=42)
+
+
+def test_world_state_view_is_readonly_alias():
+    """get_state_view shares the world's buffers without allowing writes."""
+    sheep_xy = np.full((20, 2), 50.0)
+    w = world.World(sheep_xy, np.zeros((1, 2)), np.array([100.0, 100.0]), seed=42)
+
+    view = w.get_state_view()
+    assert np.shares_memory(view.flock, w.P)
+    with pytest.raises(ValueError):
+        view.flock[0, 0] = 0.0
+
+    w.step(plan_type.DoNothing())
+    np.testing.assert_array_equal(view.flock, w.P)
+
+
+def test_world_state_view_tracks_rebound_arrays():
+    """Cached views are reused until the world rebinds one of its arrays."""
+    sheep_xy = np.full((20, 2), 50.0)
+    w = world.World(sheep_xy, np.zeros((1, 2)), np.array([100.0, 100.0]), seed=42)
+
+    first = w.get_state_view()
+    assert w.get_state_view() is first
+
+    w.set_drone_count(2)
+    resized = w.get_state_view()
+    assert resized.flock is first.flock
+    assert resized.drones.shape == (2, 2)
+    assert np.shares_memory(resized.drones, w.drones)
+
+    w.add_polygon(np.array([[0.0, 0.0], [10.0, 0.0], [10.0, 10.0]]))
+    assert len(w.get_state_view().polygons) == 1
+
+
+def test_add_polygons_batch_matches_single_adds():
+    """A (K, N, 2) batch yields the same oriented polygons and edge data."""
+    square_cw = [[0.0, 0.0], [0.0, 10.0], [10.0, 10.0], [10.0, 0.0]]
+    square_ccw = [[20.0, 20.0], [30.0, 20.0], [30.0, 30.0], [20.0, 30.0]]
+    batch = np.array([square_cw, square_ccw])
+    sheep_xy = np.full((20, 2), 50.0)
+    batched = world.World(sheep_xy, np.zeros((1, 2)), None, seed=42)
+    single = world.World(sheep_xy, np.zeros((1, 2)), None, seed=42)
+
+    batched.add_polygons(batch)
+    for poly in batch:
+        single.add_polygon(poly)
+
+    for got, want in zip(batched.poly_edges, single.poly_edges):
+        for key in ("V", "E", "N", "L"):
+            np.testing.assert_allclose(got[key], want[key])
+
+
+def test_repel_close_all_matches_per_sheep():
+    """The batched repulsion pass agrees with the per-sheep helper."""
+    rng = np.random.default_rng(0)
+    sheep_xy = rng.uniform(0.0, 20.0, size=(40, 2))
+    w = world.World(sheep_xy, np.zeros((1, 2)), None, seed=42)
+
+    expected = np.array([w._repel_close_vec(i) for i in range(w.N)])
+    np.testing.assert_allclose(w._repel_close_all(), expected, atol=1e-9)
+
+
+def test_nearest_polygon_matches_per_polygon_scan():
+    """The flattened segment table picks the same boundary point per sheep."""
+    rng = np.random.default_rng(1)
+    sheep_xy = rng.uniform(0.0, 100.0, size=(30, 2))
+    w = world.World(sheep_xy, np.zeros((1, 2)), None, seed=42)
+    w.add_polygon(np.array([[10.0, 10.0], [40.0, 10.0], [40.0, 40.0], [10.0, 40.0]]))
+    w.add_polygon(np.array([[60.0, 60.0], [90.0, 65.0], [70.0, 95.0]]))
+
+    Q, n, s = w._nearest_polygon(w.P)
+
+    for i, p in enumerate(w.P):
+        hits = [w._closest_point_on_polygon(p[None], e) for e in w.poly_edges]
+        best = min(hits, key=lambda h: abs(h[2][0]))
+        np.testing.assert_allclose(Q[i], best[0][0])
+        np.testing.assert_allclose(n[i], best[1][0])
+        assert s[i] == pytest.approx(best[2][0])
+
+    w.clear_polygons()
+    assert np.all(np.isinf(w._nearest_polygon(w.P)[2]))
+
+
+def test_kNN_all_matches_per_sheep_kNN():
+    """Batched kNN returns each sheep's neighbors nearest first, like _kNN_vec."""
+    rng = np.random.default_rng(2)
+    w = world.World(rng.uniform(0.0, 50.0, size=(40, 2)), np.zeros((1, 2)), None)
+
+    expected = np.array([w._kNN_vec(i, 5) for i in range(w.N)])
+    np.testing.assert_array_equal(w._kNN_all(5), expected)
+    np.testing.assert_array_equal(w._kNN_all(5, np.array([3, 7])), expected[[3, 7]])
+
+
+def test_reflect_bounds_leave_inside_sheep_untouched():
+    """Reflection mirrors escaped sheep and is a no-op when all are inside."""
+    sheep_xy = np.full((20, 2), 50.0)
+    w = world.World(
+        sheep_xy, np.zeros((1, 2)), None, boundary="reflect", bounds=(0, 100, 0, 100)
+    )
+    w.V[:] = 1.0
+    P, V = w.P.copy(), w.V.copy()
+
+    w._apply_bounds_sheep_inplace()
+    np.testing.assert_array_equal(w.P, P)
+    np.testing.assert_array_equal(w.V, V)
+
+    w.P[0] = [-2.0, 103.0]
+    w._apply_bounds_sheep_inplace()
+    np.testing.assert_allclose(w.P[0], [2.0, 97.0])
+    np.testing.assert_array_equal(w.P[1:], P[1:])
+    assert w.V[0, 0] > 0 and w.V[0, 1] < 0
+
+
+def test_kNN_all_keeps_stacked_sheep_as_neighbors():
+    """Coincident sheep are neighbors at distance 0; only the row itself is skipped."""
+    spread = np.column_stack([np.arange(1.0, 26.0) ** 1.5, np.zeros(25)])
+    sheep_xy = np.vstack([np.zeros((5, 2)), spread])
+    w = world.World(sheep_xy, np.zeros((1, 2)), None)
+    K = 8
+
+    nb = w._kNN_all(K)
+
+    assert nb.shape == (w.N, K)
+    for i in range(5):
+        assert i not in nb[i]
+        assert set(nb[i, :4]) == set(range(5)) - {i}
+        np.testing.assert_array_equal(nb[i, 4:], [5, 6, 7, 8])
+    d = np.linalg.norm(w.P[nb] - w.P[:, None, :], axis=2)
+    assert np.all(np.diff(d, axis=1) >= 0)
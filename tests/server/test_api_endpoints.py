@@ -1,8 +1,12 @@
+import uuid
+from types import SimpleNamespace
+
 import pytest
 
 import numpy as np
 
 from server import main
+from server.scenarios_api import Scenario
 from planning import state
 
 
@@ -75,6 +79,43 @@ def test_get_state(app_and_world):
     assert data["paused"] is True
 
 
+def test_get_state_with_job_pickled_before_drone_count(app_and_world, monkeypatch):
+    """A job loaded from a pickle that predates drone_count still renders."""
+    import pickle
+
+    # A plain-__dict__ class standing in for the old planning.state.Job
+    class LegacyJob:
+        pass
+
+    LegacyJob.__module__, LegacyJob.__qualname__ = "planning.state", "Job"
+    legacy = LegacyJob()
+    legacy.__dict__.update(
+        target=None,
+        scenario_id=None,
+        status="running",
+        is_active=True,
+        remaining_time=None,
+        start_at=None,
+        completed_at=None,
+        maintain_until="target_is_reached",
+        created_at=1000.0,
+        updated_at=1000.0,
+        id=uuid.UUID(int=1),
+    )
+    with monkeypatch.context() as m:
+        m.setattr(state, "Job", LegacyJob)
+        payload = pickle.dumps([legacy])
+
+    main.jobs_cache.list = pickle.loads(payload)
+    app, _ = app_and_world
+
+    response = app.test_client().get("/state")
+    assert response.status_code == 200
+    (job,) = response.get_json()["jobs"]
+    assert job["id"] == str(uuid.UUID(int=1))
+    assert job["drone_count"] == 1
+
+
 def test_patch_state_pause(app_and_world):
     app, w = app_and_world
     client = app.test_client()
@@ -129,3 +170,36 @@ def test_play_pause_toggle(app_and_world):
     assert response.status_code == 200
     assert response.get_json()["paused"] is True
     assert w.paused is True
+
+
+def test_load_scenario_error_details_only_in_debug(app_and_world, monkeypatch):
+    """A failing load returns a short error unless load-scenario debugging is on."""
+    scenario = Scenario(
+        id=uuid.uuid4(),
+        name="broken",
+        description=None,
+        tags=[],
+        visibility="private",
+        seed=None,
+        sheep=[[0.0, 0.0], [1.0, 1.0]],
+        drones=[[5.0, 5.0]],
+        targets=[],
+    )
+    monkeypatch.setattr(main, "REPO", SimpleNamespace(get=lambda _id: scenario))
+
+    def broken_world(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(main.world, "World", broken_world)
+    client = main.app.test_client()
+    url = f"/load-scenario/{uuid.uuid4()}"
+
+    error = client.post(url).get_json()["error"]
+    assert error["type"] == "ServerError"
+    assert "boom" in error["message"]
+    assert "traceback" not in error
+
+    monkeypatch.setattr(main, "LOAD_SCENARIO_DEBUG", True)
+    error = client.post(url).get_json()["error"]
+    assert "boom" in error["traceback"]
+    assert error["scenario_data"]["sheep_count"] == 2
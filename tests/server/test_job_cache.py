@@ -0,0 +1,154 @@
+import threading
+
+import numpy as np
+from flask import Flask
+
+from planning import state
+from server import jobs_api, metrics
+from server.main import JobCache
+
+
+def _make_job(status="pending", is_active=False):
+    return state.Job(
+        target=state.Circle(center=np.array([0.0, 0.0]), radius=10.0),
+        drone_count=1,
+        scenario_id=None,
+        status=status,
+        is_active=is_active,
+        remaining_time=None,
+        start_at=None,
+        completed_at=None,
+        maintain_until="target_is_reached",
+        created_at=1000.0,
+        updated_at=1000.0,
+    )
+
+
+def test_status_index_tracks_transitions():
+    """Running/scheduled buckets and the active pointer follow reindex()."""
+    running = _make_job("running", is_active=True)
+    scheduled = _make_job("scheduled")
+    cache = JobCache([running, scheduled])
+
+    assert cache.active_job is running
+    assert list(cache.running) == [running.id]
+    assert list(cache.scheduled) == [scheduled.id]
+
+    scheduled.status = "running"
+    running.is_active = False
+    cache.reindex(running)
+    cache.reindex(scheduled)
+
+    assert cache.active_job is None
+    assert set(cache.running) == {running.id, scheduled.id}
+    assert not cache.scheduled
+
+
+def test_purge_completed_removes_only_marked_jobs():
+    """Completed jobs are dropped from the cache and all indexes."""
+    done = _make_job("running", is_active=True)
+    other = _make_job("pending")
+    cache = JobCache([done, other])
+
+    done.status = "completed"
+    done.is_active = False
+    done.completed_at = 2000.0
+    cache.reindex(done)
+    cache.purge_completed()
+
+    assert cache.list == [other]
+    assert cache.get(done.id) is None
+    assert cache.active_job is None
+    assert not cache.running
+
+
+def test_purge_completed_keeps_reopened_jobs():
+    """A job reopened after being marked completed survives the next purge."""
+    job = _make_job("running", is_active=True)
+    cache = JobCache([job])
+
+    job.status = "completed"
+    job.is_active = False
+    job.completed_at = 2000.0
+    cache.reindex(job)
+
+    # e.g. a PATCH between the loop's completion and purge blocks
+    job.status = "running"
+    job.is_active = True
+    job.completed_at = None
+    cache.reindex(job)
+    cache.purge_completed()
+
+    assert cache.get(job.id) is job
+    assert cache.active_job is job
+    assert not cache.completed
+
+
+def test_reindex_interns_status():
+    """Statuses built at runtime (JSON, pickle) are interned on entry."""
+    job = _make_job("".join(["run", "ning"]), is_active=True)
+    assert job.status is not state.STATUS_RUNNING
+
+    cache = JobCache([job])
+
+    assert job.status is state.STATUS_RUNNING
+    assert cache.active_job is job
+
+
+def test_remove_swaps_last_job_into_slot():
+    """remove() keeps list, map and positions consistent without a rebuild."""
+    jobs = [_make_job() for _ in range(4)]
+    cache = JobCache(jobs)
+
+    assert cache.remove(jobs[1].id) is jobs[1]
+    assert cache.list == [jobs[0], jobs[3], jobs[2]]
+
+    # The moved job's new slot is tracked, so it can be removed in turn
+    assert cache.remove(jobs[3].id) is jobs[3]
+    assert cache.remove(jobs[2].id) is jobs[2]
+    assert cache.list == [jobs[0]]
+    assert cache.remove(jobs[2].id) is None
+    assert cache.get(jobs[0].id) is jobs[0]
+
+
+def test_active_pointer_follows_jobs_api_patches(tmp_path, monkeypatch):
+    """Activating/completing through PATCH /api/jobs moves the cached pointer."""
+    monkeypatch.setattr(jobs_api, "DB_PATH", tmp_path / "jobs.pkl")
+    monkeypatch.setattr(jobs_api, "_repo_instance", None)
+    first, second = _make_job(), _make_job()
+    cache = JobCache([first, second])
+
+    app = Flask(__name__)
+    app.register_blueprint(
+        jobs_api.create_jobs_blueprint(threading.Lock(), cache, lambda: None)
+    )
+    client = app.test_client()
+    start = {"status": "running", "is_active": True}
+
+    try:
+        assert client.patch(f"/api/jobs/{first.id}", json=start).status_code == 200
+        assert cache.active_job is first
+
+        # Only one job may be active: the previous one is deactivated and dropped
+        assert client.patch(f"/api/jobs/{second.id}", json=start).status_code == 200
+        assert cache.active_job is second
+        assert not first.is_active
+
+        done = {"status": "completed", "is_active": False}
+        assert client.patch(f"/api/jobs/{second.id}", json=done).status_code == 200
+        assert cache.active_job is None
+    finally:
+        if metrics.get_collector().get_current_run() is not None:
+            metrics.end_metrics_run()
+
+
+def test_snapshot_is_unaffected_by_later_removals():
+    """snapshot() freezes the job set; swap-pop removals don't reach it."""
+    jobs = [_make_job() for _ in range(3)]
+    cache = JobCache(jobs)
+
+    snap = cache.snapshot()
+    cache.remove(jobs[0].id)
+
+    assert snap == tuple(jobs)
+    assert len(cache.list) == 2
@@ -20,6 +20,9 @@ class MockJobCache:
     def get(self, job_id):
         return self.map.get(job_id)
 
+    def reindex(self, job):
+        pass
+
 
 class MockWorldAdapter:
     pass
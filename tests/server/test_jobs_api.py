@@ -2,6 +2,8 @@ import pytest
 import tempfile
 import os
 import pickle
+import threading
+import time
 
 from pathlib import Path
 from flask import Flask
@@ -27,6 +29,9 @@ class MockJobCache:
             return job
         return None
 
+    def reindex(self, job):
+        pass
+
 
 class MockWorldAdapter:
     def __init__(self):
@@ -190,3 +195,130 @@ def test_delete_job(app_and_repo):
     # Verify 404 on get
     response = client.get(f"/api/jobs/{job_id}")
     assert response.status_code == 404
+
+
+def test_sync_writer_coalesces_updates(app_and_repo):
+    app, cache, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {
+        "target": {"type": "circle", "center": [100, 100], "radius": 10},
+        "drone_count": 1,
+    }
+    job_id = client.post("/api/jobs", json=payload).get_json()["id"]
+    job = cache.list[0]
+
+    writer = jobs_api.JobSyncWriter()
+    job.remaining_time = 5.0
+    writer.submit(job)
+    job.status = "completed"
+    job.is_active = False
+    job.remaining_time = 0
+    writer.submit(job)
+
+    # Both snapshots collapse into a single write of the latest state
+    assert writer.write_pending() == 1
+    assert writer.write_pending() == 0
+
+    stored = client.get(f"/api/jobs/{job_id}").get_json()
+    assert stored["status"] == "completed"
+    assert not stored["is_active"]
+
+
+def test_sync_writer_skips_snapshots_older_than_api_writes(app_and_repo):
+    """A loop snapshot still queued behind a PATCH can't resurrect the job."""
+    app, cache, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {
+        "target": {"type": "circle", "center": [100, 100], "radius": 10},
+        "drone_count": 1,
+    }
+    job_id = client.post("/api/jobs", json=payload).get_json()["id"]
+    job = cache.list[0]
+
+    writer = jobs_api.JobSyncWriter()
+    job.status = "running"
+    job.is_active = True
+    writer.submit(job)
+
+    done = {"status": "completed", "is_active": False}
+    assert client.patch(f"/api/jobs/{job_id}", json=done).status_code == 200
+
+    writer.write_pending()
+    stored = client.get(f"/api/jobs/{job_id}").get_json()
+    assert stored["status"] == "completed"
+    assert not stored["is_active"]
+
+    # A snapshot taken after the PATCH is written as usual
+    writer.submit_fields(job.id, {"remaining_time": 3.0})
+    assert writer.write_pending() == 1
+    assert jobs_api.get_repo().get(job.id).remaining_time == 3.0
+
+
+def test_sync_writer_keeps_completion_behind_unrelated_patch(app_and_repo):
+    """A PATCH to other fields doesn't drop a queued completion snapshot."""
+    app, cache, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {
+        "target": {"type": "circle", "center": [100, 100], "radius": 10},
+        "drone_count": 1,
+    }
+    job_id = client.post("/api/jobs", json=payload).get_json()["id"]
+    job = cache.list[0]
+
+    writer = jobs_api.JobSyncWriter()
+    job.status = "completed"
+    job.is_active = False
+    job.completed_at = time.time()
+    writer.submit(job)
+
+    assert (
+        client.patch(f"/api/jobs/{job_id}", json={"drone_count": 2}).status_code == 200
+    )
+
+    assert writer.write_pending() == 1
+    stored = jobs_api.get_repo().get(job.id)
+    assert stored.status == "completed"
+    assert not stored.is_active
+    assert stored.completed_at == job.completed_at
+    assert stored.drone_count == 2
+
+
+def test_repo_writes_from_threads_are_not_lost(app_and_repo):
+    """Concurrent creates and writer flushes never drop each other's jobs."""
+    repo = jobs_api.get_repo()
+    first = repo.create(
+        target=None,
+        is_active=True,
+        drone_count=1,
+        status="running",
+        start_at=None,
+        scenario_id=None,
+    )
+    writer = jobs_api.JobSyncWriter()
+
+    def flush_updates():
+        for i in range(20):
+            writer.submit_fields(first.id, {"remaining_time": float(i)})
+            writer.write_pending()
+
+    flusher = threading.Thread(target=flush_updates)
+    flusher.start()
+    created = [
+        repo.create(
+            target=None,
+            is_active=False,
+            drone_count=1,
+            status="pending",
+            start_at=None,
+            scenario_id=None,
+        )
+        for _ in range(20)
+    ]
+    flusher.join()
+
+    stored_ids = {j.id for j in repo.list()}
+    assert {j.id for j in created} | {first.id} <= stored_ids
+    assert repo.get(first.id).remaining_time == 19.0
@@ -27,6 +27,15 @@ def test_start_stop_run(collector):
     assert "test-run" in collector.completed_runs
 
 
+def test_metrics_enabled_flag_tracks_global_run(collector):
+    metrics.end_metrics_run()  # Other tests may leave a global run active
+    assert metrics.METRICS_ENABLED is False
+    metrics.start_metrics_run("flag-run")
+    assert metrics.METRICS_ENABLED is True
+    metrics.end_metrics_run()
+    assert metrics.METRICS_ENABLED is False
+
+
 def test_record_step(collector):
     collector.start_run("test-run")
 
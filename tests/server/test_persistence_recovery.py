@@ -18,6 +18,9 @@ class MockJobCache:
         self.list.append(job)
         self.map[job.id] = job
 
+    def reindex(self, job):
+        pass
+
 
 class MockWorldAdapter:
     pass
@@ -0,0 +1,82 @@
+import json
+from dataclasses import FrozenInstanceError, asdict
+
+import pytest
+
+from server import scenario_types
+
+
+@pytest.mark.parametrize("key", sorted(scenario_types.SCENARIO_TYPES))
+def test_to_dict_matches_asdict(key):
+    """The hand-written to_dict keeps the exact asdict() payload."""
+    st = scenario_types.SCENARIO_TYPES[key]
+    expected = asdict(st)
+    del expected["layout_mode"]  # derived, internal field
+    expected["tags"] = list(expected["tags"])  # JSON-friendly list
+    assert st.to_dict() == expected
+
+
+def test_to_dict_result_is_detached_from_registry():
+    """Mutating a serialized type never leaks back into the registry."""
+    st = scenario_types.get_scenario_type("evacuation_prototype")
+    data = st.to_dict()
+
+    data["default_world_config"]["k_nn"] = 99
+    data["tags"].append("mutated")
+
+    assert st.default_world_config["k_nn"] == 1
+    assert "mutated" not in st.tags
+    with pytest.raises(FrozenInstanceError):
+        st.name = "renamed"
+
+
+def test_cached_json_matches_to_dict():
+    """The import-time JSON payloads decode to the current definitions."""
+    types = scenario_types.list_scenario_types()
+
+    assert json.loads(scenario_types.list_scenario_types_json()) == [
+        st.to_dict() for st in types
+    ]
+    for st in types:
+        assert json.loads(scenario_types.get_scenario_type_json(st.key)) == (
+            st.to_dict()
+        )
+    assert scenario_types.get_scenario_type_json("missing") is None
+
+
+def test_generate_initial_layout_is_seeded_and_in_bounds():
+    """Layouts are reproducible per seed and padded inside the world bounds."""
+    st = scenario_types.get_scenario_type("oil_spill_cleanup")
+    bounds = (0.0, 250.0, 0.0, 250.0)
+
+    layout = scenario_types.generate_initial_layout(st, seed=3, bounds=bounds)
+
+    assert layout == scenario_types.generate_initial_layout(st, seed=3, bounds=bounds)
+    assert len(layout["sheep"]) == st.recommended_agents
+    assert len(layout["drones"]) == st.recommended_controllers
+    pad = scenario_types.BOUNDS_PADDING
+    for x, y in layout["sheep"] + layout["drones"]:
+        assert pad <= x <= bounds[1] - pad
+        assert pad <= y <= bounds[3] - pad
+
+
+def test_layout_mode_is_derived_from_tags():
+    """Tagging a type with "clusters" switches its agent layout generator."""
+    plain = scenario_types.ScenarioTypeDefinition(key="a", name="A", description="")
+    clustered = scenario_types.ScenarioTypeDefinition(
+        key="b", name="B", description="", tags=("clusters",)
+    )
+    assert plain.layout_mode == "default"
+    assert clustered.layout_mode == "clusters"
+
+    layout = scenario_types.generate_initial_layout(clustered, num_agents=60, seed=1)
+    assert len(layout["sheep"]) == 60
+
+
+def test_registry_is_read_only():
+    """The shared registry can be read but not modified."""
+    with pytest.raises(TypeError):
+        scenario_types.SCENARIO_TYPES["custom"] = scenario_types.get_scenario_type(
+            "herding_standard"
+        )
+    assert "custom" not in scenario_types.SCENARIO_TYPES
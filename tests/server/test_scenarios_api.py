@@ -3,7 +3,9 @@ import tempfile
 import os
 import pickle
 from pathlib import Path
-from flask import Flask
+from uuid import UUID
+from dataclasses import asdict
+from flask import Flask, json as flask_json
 from server import scenarios_api
 
 
@@ -97,3 +99,288 @@ def test_get_scenario(app_and_repo):
 # DELETE route not implemented in API yet
 # def test_delete_scenario(app_and_repo):
 #     ...
+
+
+def test_custom_scenarios_survive_repo_reload(app_and_repo):
+    app, _, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {"name": "Kept", "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]}}
+    scen_id = UUID(client.post("/scenarios", json=payload).get_json()["id"])
+
+    # A fresh repo reads what the first one wrote through to disk
+    reloaded = scenarios_api.ScenarioRepo()
+    assert reloaded.get(scen_id).name == "Kept"
+
+
+def test_get_falls_back_to_lock_during_write(app_and_repo):
+    """A read overlapping a write (odd version) still returns the committed item."""
+    app, repo, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {"name": "Test", "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]}}
+    scen_id = UUID(client.post("/scenarios", json=payload).get_json()["id"])
+
+    repo._version += 1  # as if a writer were mid-update
+    try:
+        assert repo.get(scen_id).name == "Test"
+        items, total = repo.list(
+            q=None,
+            tag=None,
+            visibility=None,
+            created_after=None,
+            created_before=None,
+            sort="-created_at",
+            limit=20,
+            offset=0,
+        )
+        assert total == 1
+    finally:
+        repo._version += 1
+
+
+def test_list_filters_refresh_after_writes(app_and_repo):
+    """Tag/visibility/text filters see scenarios created after a previous list."""
+    app, repo, _ = app_and_repo
+    client = app.test_client()
+
+    def create(name, tags, visibility="private"):
+        payload = {
+            "name": name,
+            "tags": tags,
+            "visibility": visibility,
+            "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]},
+        }
+        return client.post("/scenarios", json=payload).get_json()["id"]
+
+    create("Sheep pen", ["farm"])
+    assert client.get("/scenarios?tag=farm").get_json()["total"] == 1
+
+    public_id = create("Big Sheepfold", ["farm", "large"], visibility="public")
+    create("City run", ["urban"], visibility="public")
+
+    data = client.get("/scenarios?tag=farm&visibility=public").get_json()
+    assert [s["id"] for s in data["items"]] == [public_id]
+    # q is a case-insensitive substring match over name, description and tags
+    assert client.get("/scenarios?q=SHEEP").get_json()["total"] == 2
+    assert client.get("/scenarios?q=arg").get_json()["total"] == 1
+
+    repo.delete(UUID(public_id))
+    assert client.get("/scenarios?tag=farm").get_json()["total"] == 1
+
+
+def test_list_sorts_and_paginates(app_and_repo):
+    app, _, _ = app_and_repo
+    client = app.test_client()
+
+    for name in ("Charlie", "alpha", "Bravo"):
+        payload = {"name": name, "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]}}
+        assert client.post("/scenarios", json=payload).status_code == 201
+
+    names = [
+        s["name"]
+        for offset in (0, 2)
+        for s in client.get(f"/scenarios?sort=name&limit=2&offset={offset}").get_json()[
+            "items"
+        ]
+    ]
+    assert names == ["Bravo", "Charlie", "alpha"]
+
+    newest = client.get("/scenarios?sort=-created_at&limit=1").get_json()
+    assert newest["total"] == 3
+    assert newest["items"][0]["name"] == "Bravo"
+
+
+def test_scenario_json_matches_jsonify_and_is_not_pickled(app_and_repo):
+    """Cached scenario JSON decodes like jsonify(asdict(s)) and stays in memory."""
+    app, repo, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {"name": "Cached", "entities": {"sheep": [[0, 0]], "drones": [[1, 2]]}}
+    scen_id = UUID(client.post("/scenarios", json=payload).get_json()["id"])
+    s = repo.get(scen_id)
+
+    with app.app_context():
+        expected = flask_json.loads(flask_json.dumps(asdict(s)))
+    assert client.get(f"/scenarios/{scen_id}").get_json() == expected
+    assert client.get("/scenarios").get_json()["items"] == [expected]
+    assert s.to_json() is s.to_json()
+    assert "_json" not in pickle.loads(pickle.dumps(s)).__dict__
+
+
+def test_create_scenario_from_spawn_block(app_and_repo):
+    """Spawned positions come back as rounded [x, y] pairs, drones included."""
+    app, _, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {
+        "name": "Spawned",
+        "spawn": {
+            "kind": "uniform",
+            "num_sheep": 25,
+            "seed": 4,
+            "drones": [{"around": [50, 50], "radius": 10, "count": 3}],
+            "targets": [[1, 2]],
+        },
+    }
+    data = client.post("/scenarios", json=payload).get_json()
+
+    assert len(data["sheep"]) == 25
+    assert len(data["drones"]) == 3
+    assert data["targets"] == [[1.0, 2.0]]
+    for x, y in data["sheep"] + data["drones"]:
+        assert round(x, 9) == x and round(y, 9) == y
+    for x, y in data["drones"]:
+        assert (x - 50) ** 2 + (y - 50) ** 2 == pytest.approx(100.0)
+
+
+def test_idempotency_key_replays_same_body_only(app_and_repo):
+    """A reused Idempotency-Key replays its scenario unless the body changed."""
+    app, _, _ = app_and_repo
+    client = app.test_client()
+    headers = {"Idempotency-Key": "abc"}
+    payload = {"name": "Once", "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]}}
+
+    first = client.post("/scenarios", json=payload, headers=headers)
+    replay = client.post(
+        "/scenarios", json=dict(reversed(payload.items())), headers=headers
+    )
+    assert replay.status_code == 201
+    assert replay.get_json()["id"] == first.get_json()["id"]
+
+    changed = client.post(
+        "/scenarios", json={**payload, "name": "Twice"}, headers=headers
+    )
+    assert changed.status_code == 409
+    assert client.get("/scenarios").get_json()["total"] == 1
+
+
+def test_idempotency_key_hashes_bodies_with_wide_integers(app_and_repo):
+    """Bodies orjson can't encode still hash, create and replay."""
+    app, _, _ = app_and_repo
+    client = app.test_client()
+    headers = {"Idempotency-Key": "wide"}
+    payload = {
+        "name": "Wide",
+        "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]},
+        "extra": 2**70,
+    }
+
+    first = client.post("/scenarios", json=payload, headers=headers)
+    assert first.status_code == 201
+    replay = client.post("/scenarios", json=payload, headers=headers)
+    assert replay.status_code == 201
+    assert replay.get_json()["id"] == first.get_json()["id"]
+
+
+def test_scenario_json_falls_back_for_values_orjson_rejects(app_and_repo):
+    """Values only the stdlib encoder accepts still serialize (no 500)."""
+    app, _, _ = app_and_repo
+    client = app.test_client()
+    payload = {
+        "name": "Wide",
+        "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]},
+        "world_config": {"huge": 2**70},
+    }
+
+    created = client.post("/scenarios", json=payload)
+    assert created.status_code == 201
+    assert created.get_json()["world_config"] == {"huge": 2**70}
+    assert scenarios_api._dumps({"b": 2**70, "a": 1}) == (
+        b'{"a":1,"b":1180591620717411303424}'
+    )
+
+
+@pytest.mark.parametrize(
+    "sheep, message",
+    [
+        ([[0, 0], [1]], "coordinate must be [x, y]"),
+        ([[0, "x"]], "coordinate must be [x, y]"),
+        ([0, 1], "coordinate must be [x, y]"),
+        ([[0, float("inf")]], "coordinate must be finite"),
+    ],
+)
+def test_create_scenario_rejects_bad_points(app_and_repo, sheep, message):
+    app, _, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {"name": "Bad", "entities": {"sheep": sheep, "drones": [[0, 0]]}}
+    response = client.post("/scenarios", json=payload)
+
+    assert response.status_code == 422
+    assert response.get_json()["error"]["message"] == message
+
+
+def test_spawned_drone_groups_draw_distinct_angles(app_and_repo):
+    """Several "around" groups share one generator instead of repeating draws."""
+    app, _, _ = app_and_repo
+    client = app.test_client()
+
+    group = {"around": [50, 50], "radius": 10, "count": 2}
+    payload = {
+        "name": "Drones",
+        "spawn": {"num_sheep": 5, "seed": 8, "drones": [group, group]},
+    }
+    drones = client.post("/scenarios", json=payload).get_json()["drones"]
+
+    assert len(drones) == 4
+    assert drones[:2] != drones[2:]
+
+
+def test_presets_are_encoded_when_seeded(app_and_repo):
+    app, repo, _ = app_and_repo
+    scenarios_api._seed_presets()
+
+    presets = list(repo._presets.values())
+    assert presets
+    assert all("_json" in p.__dict__ for p in presets)
+
+
+def test_list_created_filters_compare_instants(app_and_repo):
+    """Date filters compare moments in time, whatever offset they are written in."""
+    app, repo, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {"name": "Dated", "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]}}
+    sid = UUID(client.post("/scenarios", json=payload).get_json()["id"])
+    repo.get(sid).created_at = "2024-05-01T12:00:00+00:00"
+    repo._index = None
+
+    def total(**params):
+        return client.get("/scenarios", query_string=params).get_json()["total"]
+
+    assert total(created_after="2024-05-01T13:00:00+02:00") == 1
+    assert total(created_after="2024-05-01T11:00:00-02:00") == 0
+    assert total(created_before="2024-05-01T12:00:01Z") == 1
+    assert total(created_before="2024-05-01") == 0
+
+    response = client.get("/scenarios", query_string={"created_after": "yesterday"})
+    assert response.status_code == 422
+
+
+def test_list_reports_only_bad_query_bounds_as_validation_errors(app_and_repo):
+    """A malformed stored created_at only drops that scenario from date filters."""
+    app, repo, _ = app_and_repo
+    client = app.test_client()
+
+    payload = {"name": "Broken", "entities": {"sheep": [[0, 0]], "drones": [[0, 0]]}}
+    sid = client.post("/scenarios", json=payload).get_json()["id"]
+    scenario = repo.get(UUID(sid))
+    good = scenario.created_at
+    scenario.created_at = "not a timestamp"
+    repo._index = None
+    try:
+        response = client.get("/scenarios")
+        assert response.status_code == 200
+        assert sid in [s["id"] for s in response.get_json()["items"]]
+
+        for bound in ("created_after", "created_before"):
+            response = client.get("/scenarios", query_string={bound: "2024-01-01"})
+            assert response.status_code == 200
+            assert sid not in [s["id"] for s in response.get_json()["items"]]
+    finally:
+        scenario.created_at = good
+        repo._index = None
+
+    response = client.get("/scenarios", query_string={"created_before": "soon"})
+    assert response.status_code == 422
@@ -91,3 +91,79 @@ def test_stream_headers(app_and_stream_world):
     response = client.get("/stream/state")
     assert response.headers["Cache-Control"] == "no-cache"
     assert response.headers["X-Accel-Buffering"] == "no"
+
+
+def test_stream_frame_shared_between_subscribers(app_and_stream_world):
+    """Concurrent subscribers reuse one encoded frame per broadcast interval."""
+    main.state_broadcaster._expires = 0.0
+
+    first = main.state_broadcaster.frame()
+    second = main.state_broadcaster.frame()
+
+    assert first is second
+    assert first.startswith(b"event: stateUpdate\ndata: {")
+
+
+def test_seqlock_read_retries_torn_snapshot():
+    """A snapshot overlapping a write is discarded and retaken."""
+    lock = main.SeqLock()
+    calls = []
+
+    def snapshot():
+        calls.append(lock.seq)
+        if len(calls) == 1:
+            # Simulate the tick writing while the reader copies
+            with lock:
+                pass
+        return len(calls)
+
+    assert lock.read(snapshot) == 2
+    assert calls == [0, 2]
+
+
+def test_dumps_json_encodes_numpy_like_tolist():
+    """dumps_json output matches json.dumps on the tolist() form."""
+    payload = {
+        "flock": np.array([[1.5, 2.0], [3.0, 4.25]]),
+        "polygons": [np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])],
+        "paused": False,
+    }
+    expected = {
+        "flock": payload["flock"].tolist(),
+        "polygons": [payload["polygons"][0].tolist()],
+        "paused": False,
+    }
+
+    assert json.loads(main.dumps_json(payload)) == expected
+
+
+def test_stream_frame_reencoded_only_after_world_write(app_and_stream_world):
+    """An expired frame is reused until something writes under world_lock."""
+    _, w = app_and_stream_world
+    first = main.state_broadcaster.frame()
+
+    main.state_broadcaster._expires = 0.0
+    assert main.state_broadcaster.frame() is first
+
+    with main.world_lock:
+        w.P = np.ones((10, 2))
+    main.state_broadcaster._expires = 0.0
+    updated = main.state_broadcaster.frame()
+
+    assert updated is not first
+    assert json.loads(updated.split(b"data: ", 1)[1])["flock"][0] == [1.0, 1.0]
+
+
+def test_get_state_reuses_body_until_world_write(app_and_stream_world):
+    """GET /state shares the encoded state and still reflects the latest write."""
+    app, w = app_and_stream_world
+    client = app.test_client()
+
+    first = client.get("/state").get_data()
+    assert client.get("/state").get_data() == first
+    assert main.state_broadcaster.body() is main.state_broadcaster.body()
+
+    with main.world_lock:
+        w.P = np.ones((10, 2))
+
+    assert client.get("/state").get_json()["flock"][0] == [1.0, 1.0]
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from simulation import scenarios
 
@@ -85,3 +86,40 @@ def test_spawn_edge_cases():
     # N=1
     pts1 = scenarios.spawn_uniform(1, bounds)
     assert pts1.shape == (1, 2)
+
+    # Every spawner keeps the (N, 2) shape when empty
+    assert scenarios.spawn_corners(0, bounds).shape == (0, 2)
+    assert scenarios.spawn_clusters(0, 2, bounds).shape == (0, 2)
+
+
+def test_spawn_clusters_sizes_differ_by_at_most_one():
+    """Points are split over clusters in order, the first ones taking the extras."""
+    pts = scenarios.spawn_clusters(10, 3, (0, 1000, 0, 1000), spread=0.0, seed=1)
+
+    _, counts = np.unique(pts, axis=0, return_counts=True)
+    assert sorted(counts) == [3, 3, 4]
+    np.testing.assert_array_equal(pts[0], pts[3])
+
+
+def test_spawn_uniform_matches_per_axis_draws():
+    """Same values as drawing x then y with rng.uniform, in C order."""
+    bounds = (-5.0, 120.0, 3.0, 40.0)
+    rng = np.random.default_rng(7)
+    x = rng.uniform(-4.0, 119.0, 20)
+    y = rng.uniform(4.0, 39.0, 20)
+
+    pts = scenarios.spawn_uniform(20, bounds, seed=7)
+
+    np.testing.assert_array_equal(pts, np.stack([x, y], axis=1))
+    assert pts.flags.c_contiguous
+
+
+def test_spawn_corners_cycles_through_corners():
+    """Point i sits (up to jitter) on corner i % 4, for any N."""
+    bounds = (0, 100, 0, 50)
+    corners = np.array([[2, 2], [2, 48], [98, 2], [98, 48]], dtype=float)
+    pts = scenarios.spawn_corners(10, bounds, jitter=0.0, seed=1)
+
+    np.testing.assert_array_equal(pts, corners[np.arange(10) % 4])
+    with pytest.raises(ValueError):
+        scenarios.spawn_corners(4, bounds, jitter=-1.0)
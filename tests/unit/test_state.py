@@ -44,6 +44,11 @@ def test_job_serialization():
     assert d["completed_at"] is None
     assert d["maintain_until"] == "target_is_reached"
 
+    # Cached timestamp formatting still tracks transitions
+    assert d["start_at"] == "1970-01-01T00:16:40Z"
+    job.completed_at = 2000.0
+    assert job.to_dict()["completed_at"] == "1970-01-01T00:33:20Z"
+
 
 def test_state_serialization():
     """Test full State to_dict."""
@@ -54,3 +59,92 @@ def test_state_serialization():
     assert len(d["flock"]) == 2
     assert len(d["drones"]) == 1
     assert d["jobs"] == []
+
+
+def test_job_target_center():
+    """target_center is the circle center or the (cached) polygon centroid."""
+    job = state.Job(
+        target=state.Circle(center=np.array([3.0, 4.0]), radius=1.0),
+        drone_count=1,
+        status="pending",
+        is_active=False,
+        remaining_time=None,
+        start_at=None,
+        completed_at=None,
+        scenario_id=None,
+        maintain_until="target_is_reached",
+        created_at=1000.0,
+        updated_at=1000.0,
+    )
+    assert job.target_center.tolist() == [3.0, 4.0]
+
+    job.target = state.Polygon(points=np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 2.0]]))
+    assert job.target_center.tolist() == [8.0 / 3.0, 2.0 / 3.0]
+    assert job.target_center is job.target_center
+
+    job.target = None
+    assert job.target_center is None
+
+
+def test_job_unpickles_legacy_dict_state(monkeypatch):
+    """Jobs pickled before Job used __slots__ still load from the job DB."""
+    import pickle
+    import uuid
+
+    fields = {
+        "target": None,
+        "drone_count": 3,
+        "scenario_id": None,
+        "status": "running",
+        "is_active": True,
+        "remaining_time": 12.5,
+        "start_at": None,
+        "completed_at": None,
+        "maintain_until": "target_is_reached",
+        "created_at": 1000.0,
+        "updated_at": 1001.0,
+        "id": uuid.UUID(int=7),
+    }
+
+    # A plain-__dict__ class standing in for the pre-slots planning.state.Job
+    class LegacyJob:
+        pass
+
+    LegacyJob.__module__, LegacyJob.__qualname__ = "planning.state", "Job"
+    legacy = LegacyJob()
+    legacy.__dict__.update(fields)
+    with monkeypatch.context() as m:
+        m.setattr(state, "Job", LegacyJob)
+        payload = pickle.dumps([legacy])
+
+    (restored,) = pickle.loads(payload)
+    assert type(restored) is state.Job
+    assert not hasattr(restored, "__dict__")
+    for name, value in fields.items():
+        assert getattr(restored, name) == value
+
+    # Re-pickled in the slotted format, it round-trips unchanged
+    assert pickle.loads(pickle.dumps(restored)).to_dict() == restored.to_dict()
+
+
+def test_job_fields_to_dict_matches_to_dict():
+    """The field-row encoder used by /state agrees with Job.to_dict()."""
+    from dataclasses import fields
+
+    job = state.Job(
+        target=state.Circle(center=np.array([3.0, 4.0]), radius=1.0),
+        drone_count=2,
+        status="scheduled",
+        is_active=False,
+        remaining_time=4.5,
+        start_at=1500.0,
+        completed_at=None,
+        scenario_id="abc",
+        maintain_until=3000.0,
+        created_at=1000.0,
+        updated_at=1200.0,
+    )
+    row = [getattr(job, f.name) for f in fields(state.Job)]
+
+    assert state.job_fields_to_dict(*row) == job.to_dict()
+    assert job.to_dict()["maintain_until"] == "1970-01-01T00:50:00Z"